@@ -1,9 +1,13 @@
 import hashlib
 import json
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
 import redis.asyncio as redis
 from fastapi import Depends, HTTPException, Request, Response
+from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +15,13 @@ from app.api.deps import get_db
 from app.core.redis import get_redis_client
 from app.models.items import ContentItem
 
+# Computed responses keyed by the ETag they were served under. An ETag names both the
+# request and the state of its data, so a new ingest changes the key rather than
+# needing an invalidation hook
+VIEW_CACHE_TTL_SECONDS = 30.0
+VIEW_CACHE_MAX_ENTRIES = 256
+_VIEW_CACHE: OrderedDict[str, tuple[float, BaseModel]] = OrderedDict()
+
 
 class CacheInfo:
     """Container for cache-related information."""
@@ -31,10 +42,11 @@ def generate_request_fingerprint(request: Request) -> str:
     Returns:
         SHA256 hash of the request fingerprint
     """
-    # Create a consistent representation of the request
+    # Create a consistent representation of the request; every value of a repeated
+    # parameter counts, not just the last one
     fingerprint_data = {
         "path": str(request.url.path),
-        "query_params": dict(request.query_params),
+        "query_params": sorted(request.query_params.multi_items()),
     }
 
     # Sort the dictionary to ensure consistent ordering
@@ -46,7 +58,7 @@ def generate_request_fingerprint(request: Request) -> str:
 
 async def generate_data_fingerprint(
     db: AsyncSession,
-    source_name: str | None = None,
+    source_names: Sequence[str] | None = None,
     q: str | None = None,
     window_start: datetime | None = None,
 ) -> tuple[str, datetime]:
@@ -55,7 +67,7 @@ async def generate_data_fingerprint(
 
     Args:
         db: Database session
-        source_name: Optional source filter
+        source_names: Optional filter by source names
         q: Optional search query
         window_start: Optional time window filter
 
@@ -71,8 +83,8 @@ async def generate_data_fingerprint(
     ).select_from(ContentItem)
 
     # Apply filters similar to the main queries
-    if source_name:
-        query = query.join(Source).where(Source.name == source_name)
+    if source_names:
+        query = query.join(Source).where(Source.name.in_(source_names))
 
     if q:
         from sqlalchemy import or_
@@ -179,6 +191,7 @@ async def cache_dependency(
 
     # Extract common query parameters for data fingerprint
     source_name = request.query_params.get("source_name")
+    source_names = [source_name] if source_name else None
     q = request.query_params.get("q")
 
     # Handle window parameter for stats/trending endpoints
@@ -195,8 +208,19 @@ async def cache_dependency(
         except (ValueError, ImportError):
             pass
 
+    # The analytics bundle filters by every given source, while its stats, time series and
+    # trending items ignore the search query and its items ignore the window. Its JSON and
+    # Arrow representations are told apart by the negotiated media type
+    if request.url.path.endswith("/analytics"):
+        from app.api.v1.items import _bundle_media_type
+
+        source_names = sorted(request.query_params.getlist("sources")) or None
+        q = None
+        media_type = _bundle_media_type(request.query_params.getlist("fields"), request.headers.get("accept"))
+        request_fingerprint = f"{request_fingerprint}:{media_type}"
+
     # Generate data fingerprint
-    data_fingerprint, last_modified = await generate_data_fingerprint(db, source_name, q, window_start)
+    data_fingerprint, last_modified = await generate_data_fingerprint(db, source_names, q, window_start)
 
     # Generate ETag
     etag = generate_etag(request_fingerprint, data_fingerprint)
@@ -238,3 +262,41 @@ def set_cache_headers(response: Response, cache_info: CacheInfo) -> None:
     response.headers["Last-Modified"] = cache_info.last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT")
     response.headers["Cache-Control"] = "public, max-age=30, stale-while-revalidate=60"
     response.headers["Vary"] = "Accept, X-API-Key"
+
+
+def get_cached_view[ViewT: BaseModel](etag: str, view_type: type[ViewT]) -> ViewT | None:
+    """
+    Return the response computed for an ETag if its entry has not expired.
+
+    Args:
+        etag: ETag the response was computed under
+        view_type: Response model expected for the ETag
+
+    Returns:
+        Cached response or None on cache miss
+    """
+    entry = _VIEW_CACHE.get(etag)
+    if entry is None:
+        return None
+
+    cached_at, view = entry
+    if time.monotonic() - cached_at > VIEW_CACHE_TTL_SECONDS or not isinstance(view, view_type):
+        _VIEW_CACHE.pop(etag, None)
+        return None
+
+    _VIEW_CACHE.move_to_end(etag)
+    return view
+
+
+def cache_view(etag: str, view: BaseModel) -> None:
+    """
+    Store a computed response under its ETag, evicting the least recently used entries.
+
+    Args:
+        etag: ETag the response is served under
+        view: Computed response
+    """
+    _VIEW_CACHE[etag] = (time.monotonic(), view)
+    _VIEW_CACHE.move_to_end(etag)
+    while len(_VIEW_CACHE) > VIEW_CACHE_MAX_ENTRIES:
+        _VIEW_CACHE.popitem(last=False)
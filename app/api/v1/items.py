@@ -1,16 +1,27 @@
-from datetime import datetime, timedelta
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+import pyarrow as pa
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.caching import CacheInfo, cache_dependency, set_cache_headers
+from app.api.caching import CacheInfo, cache_dependency, cache_view, get_cached_view, set_cache_headers
 from app.api.deps import get_db
 from app.core.pagination import decode_cursor, encode_cursor
 from app.models.items import ContentItem
 from app.models.source import Source
-from app.schemas.items import ContentItemCursorPage, ContentItemResponse, ItemsStats, PaginatedContentItems, SourceStat
+from app.schemas.items import (
+    AnalyticsBundle,
+    ContentItemCursorPage,
+    ContentItemResponse,
+    ItemsStats,
+    PaginatedContentItems,
+    SourceStat,
+    TimeSeriesPoint,
+)
 
 router = APIRouter()
 
@@ -233,6 +244,62 @@ def _parse_window(window: str) -> timedelta:
     raise ValueError(f"Invalid window format: {window}. Use format like '24h', '7d', '1w'")
 
 
+async def _compute_stats(db: AsyncSession, window_start: datetime, source_names: Sequence[str] | None) -> ItemsStats:
+    """Compute the items statistics, optionally for some sources, counting new items since window_start."""
+    # Base query for filtering
+    base_query = select(ContentItem)
+    if source_names:
+        base_query = base_query.join(Source).where(Source.name.in_(source_names))
+
+    # Total items count
+    total_query = select(func.count(ContentItem.id))
+    if source_names:
+        total_query = total_query.select_from(ContentItem).join(Source).where(Source.name.in_(source_names))
+    else:
+        total_query = total_query.select_from(ContentItem)
+
+    total_items = (await db.execute(total_query)).scalar_one()
+
+    # New items in window count
+    new_query = select(func.count(ContentItem.id)).select_from(ContentItem)
+    if source_names:
+        new_query = new_query.join(Source).where(
+            and_(Source.name.in_(source_names), ContentItem.created_at >= window_start),
+        )
+    else:
+        new_query = new_query.where(ContentItem.created_at >= window_start)
+
+    new_last_window = (await db.execute(new_query)).scalar_one()
+
+    # Top sources by item count
+    sources_query = (
+        select(Source.name, func.count(ContentItem.id).label("item_count")).select_from(ContentItem).join(Source)
+    )
+    if source_names:
+        sources_query = sources_query.where(Source.name.in_(source_names))
+
+    sources_query = sources_query.group_by(Source.name).order_by(func.count(ContentItem.id).desc()).limit(10)
+
+    sources_result = await db.execute(sources_query)
+    top_sources = [SourceStat(source_name=row.name, item_count=row.item_count) for row in sources_result]
+
+    # Score statistics
+    score_query = select(func.max(ContentItem.score), func.avg(ContentItem.score)).select_from(ContentItem)
+    if source_names:
+        score_query = score_query.join(Source).where(Source.name.in_(source_names))
+
+    score_result = await db.execute(score_query)
+    max_score, avg_score = score_result.one()
+
+    return ItemsStats(
+        total_items=total_items,
+        new_last_window=new_last_window,
+        top_sources=top_sources,
+        max_score=float(max_score) if max_score is not None else None,
+        avg_score=float(avg_score) if avg_score is not None else None,
+    )
+
+
 @router.get(
     "/stats",
     response_model=ItemsStats,
@@ -280,63 +347,59 @@ async def get_items_stats(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    window_start = datetime.utcnow() - window_delta
+    # Statistics already computed for the same request and data state are served as is
+    stats = get_cached_view(cache_info.etag, ItemsStats)
+    if stats is None:
+        window_start = datetime.utcnow() - window_delta
+        stats = await _compute_stats(db, window_start, [source_name] if source_name else None)
+        cache_view(cache_info.etag, stats)
 
-    # Base query for filtering
-    base_query = select(ContentItem)
-    if source_name:
-        base_query = base_query.join(Source).where(Source.name == source_name)
-
-    # Total items count
-    total_query = select(func.count(ContentItem.id))
-    if source_name:
-        total_query = total_query.select_from(ContentItem).join(Source).where(Source.name == source_name)
-    else:
-        total_query = total_query.select_from(ContentItem)
-
-    total_items = (await db.execute(total_query)).scalar_one()
-
-    # New items in window count
-    new_query = select(func.count(ContentItem.id)).select_from(ContentItem)
-    if source_name:
-        new_query = new_query.join(Source).where(
-            and_(Source.name == source_name, ContentItem.created_at >= window_start),
-        )
-    else:
-        new_query = new_query.where(ContentItem.created_at >= window_start)
+    # Set cache headers
+    set_cache_headers(response, cache_info)
 
-    new_last_window = (await db.execute(new_query)).scalar_one()
+    return stats
 
-    # Top sources by item count
-    sources_query = (
-        select(Source.name, func.count(ContentItem.id).label("item_count")).select_from(ContentItem).join(Source)
-    )
-    if source_name:
-        sources_query = sources_query.where(Source.name == source_name)
 
-    sources_query = sources_query.group_by(Source.name).order_by(func.count(ContentItem.id).desc()).limit(10)
+async def _query_trending(
+    db: AsyncSession,
+    window_start: datetime,
+    source_names: Sequence[str] | None,
+    limit: int,
+    use_hot_score: bool,
+) -> Sequence[ContentItem]:
+    """Query the top items published since window_start, ranked by score or hot score."""
+    # Build the base query
+    query = select(ContentItem).options(selectinload(ContentItem.source))
 
-    sources_result = await db.execute(sources_query)
-    top_sources = [SourceStat(source_name=row.name, item_count=row.item_count) for row in sources_result]
+    # Apply source filter if provided
+    if source_names:
+        query = query.join(Source).where(Source.name.in_(source_names))
 
-    # Score statistics
-    score_query = select(func.max(ContentItem.score), func.avg(ContentItem.score)).select_from(ContentItem)
-    if source_name:
-        score_query = score_query.join(Source).where(Source.name == source_name)
+    # Filter items within the time window
+    query = query.where(ContentItem.published_at >= window_start)
 
-    score_result = await db.execute(score_query)
-    max_score, avg_score = score_result.one()
+    # Apply sorting logic
+    if use_hot_score:
+        # Hot score algorithm for PostgreSQL: ln(score + 1) + (published_at_epoch / 43200)
+        # This gives more weight to recent items with high scores
+        try:
+            hot_score = func.ln(func.coalesce(ContentItem.score, 0) + 1) + (
+                func.extract("epoch", ContentItem.published_at) / 43200
+            )
+            query = query.order_by(hot_score.desc(), ContentItem.published_at.desc())
+        except Exception:
+            # Fallback to primary sorting if hot score fails (e.g., SQLite)
+            query = query.order_by(func.coalesce(ContentItem.score, 0).desc(), ContentItem.published_at.desc())
+    else:
+        # Primary sorting: score DESC, published_at DESC
+        query = query.order_by(func.coalesce(ContentItem.score, 0).desc(), ContentItem.published_at.desc())
 
-    # Set cache headers
-    set_cache_headers(response, cache_info)
+    # Apply limit
+    query = query.limit(limit)
 
-    return ItemsStats(
-        total_items=total_items,
-        new_last_window=new_last_window,
-        top_sources=top_sources,
-        max_score=float(max_score) if max_score is not None else None,
-        avg_score=float(avg_score) if avg_score is not None else None,
-    )
+    # Execute the query
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
 @router.get(
@@ -404,41 +467,199 @@ async def get_trending_items(
 
     window_start = datetime.utcnow() - window_delta
 
-    # Build the base query
-    query = select(ContentItem).options(selectinload(ContentItem.source))
+    items = await _query_trending(db, window_start, [source_name] if source_name else None, limit, use_hot_score)
 
-    # Apply source filter if provided
-    if source_name:
-        query = query.join(Source).where(Source.name == source_name)
+    # Set cache headers
+    set_cache_headers(response, cache_info)
 
-    # Filter items within the time window
-    query = query.where(ContentItem.published_at >= window_start)
+    # Convert to response schemas
+    return [ContentItemResponse.model_validate(item) for item in items]
 
-    # Apply sorting logic
-    if use_hot_score:
-        # Hot score algorithm for PostgreSQL: ln(score + 1) + (published_at_epoch / 43200)
-        # This gives more weight to recent items with high scores
-        try:
-            hot_score = func.ln(func.coalesce(ContentItem.score, 0) + 1) + (
-                func.extract("epoch", ContentItem.published_at) / 43200
-            )
-            query = query.order_by(hot_score.desc(), ContentItem.published_at.desc())
-        except Exception:
-            # Fallback to primary sorting if hot score fails (e.g., SQLite)
-            query = query.order_by(func.coalesce(ContentItem.score, 0).desc(), ContentItem.published_at.desc())
+
+# Media type of Arrow IPC streams, which the analytics bundle can be sent as
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Item columns the analytics bundle can project its items to
+_ITEM_FIELDS = frozenset(
+    {"id", "source_id", "external_id", "title", "content", "url", "score", "published_at", "created_at", "updated_at"},
+)
+
+
+def _bundle_media_type(fields: Sequence[str] | None, accept: str | None) -> str:
+    """Negotiate the analytics bundle's media type; only projected items can be sent as an Arrow stream."""
+    if fields and accept and ARROW_STREAM_MEDIA_TYPE in accept:
+        return ARROW_STREAM_MEDIA_TYPE
+    return "application/json"
+
+
+def _arrow_bundle(bundle: AnalyticsBundle) -> bytes:
+    """
+    Serialize a bundle with projected items as an Arrow IPC stream.
+
+    The items are the stream's record batches; the rest of the bundle is small and
+    travels as JSON in the schema metadata, under the "bundle" key.
+    """
+    table = pa.Table.from_pylist(bundle.items)
+    table = table.replace_schema_metadata({"bundle": bundle.model_dump_json(exclude={"items"})})
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _bucket_counts(timestamps: Sequence[datetime], granularity: str) -> list[TimeSeriesPoint]:
+    """Count timestamps per hour or day, including empty buckets between the first and last one."""
+    step = timedelta(days=1) if granularity == "day" else timedelta(hours=1)
+    floor = {"minute": 0, "second": 0, "microsecond": 0} | ({"hour": 0} if granularity == "day" else {})
+    counts = Counter(timestamp.replace(**floor) for timestamp in timestamps)
+    if not counts:
+        return []
+
+    points = []
+    bucket, last = min(counts), max(counts)
+    while bucket <= last:
+        points.append(TimeSeriesPoint(timestamp=bucket, count=counts[bucket]))
+        bucket += step
+    return points
+
+
+async def _build_analytics_bundle(
+    db: AsyncSession,
+    window_start: datetime,
+    sources: list[str] | None,
+    q: str | None,
+    items_limit: int,
+    fields: list[str] | None,
+    trending_limit: int,
+    granularity: str,
+) -> AnalyticsBundle:
+    """Run the analytics bundle's queries one after another on the request's session."""
+    stats = await _compute_stats(db, window_start, sources)
+
+    # Most recent items, matching the search query if given; only the requested columns
+    # are selected when the items are projected
+    if fields:
+        items_query = select(*(getattr(ContentItem, field) for field in dict.fromkeys(fields)))
     else:
-        # Primary sorting: score DESC, published_at DESC
-        query = query.order_by(func.coalesce(ContentItem.score, 0).desc(), ContentItem.published_at.desc())
+        items_query = select(ContentItem).options(selectinload(ContentItem.source))
+    if sources:
+        items_query = items_query.join(Source).where(Source.name.in_(sources))
+    if q:
+        items_query = items_query.where(or_(ContentItem.title.ilike(f"%{q}%"), ContentItem.content.ilike(f"%{q}%")))
+    items_query = items_query.order_by(ContentItem.published_at.desc(), ContentItem.id.desc()).limit(items_limit)
+    items_result = await db.execute(items_query)
+    if fields:
+        items = [dict(row._mapping) for row in items_result]
+    else:
+        items = [ContentItemResponse.model_validate(item) for item in items_result.scalars()]
+
+    # Time series of the most recent items published in the window, regardless of the search query
+    published_query = select(ContentItem.published_at).where(ContentItem.published_at >= window_start)
+    if sources:
+        published_query = published_query.join(Source).where(Source.name.in_(sources))
+    published_query = published_query.order_by(ContentItem.published_at.desc(), ContentItem.id.desc()).limit(
+        items_limit,
+    )
+    published_at = (await db.execute(published_query)).scalars().all()
 
-    # Apply limit
-    query = query.limit(limit)
+    trending = await _query_trending(db, window_start, sources, trending_limit, use_hot_score=False)
 
-    # Execute the query
-    result = await db.execute(query)
-    items = result.scalars().all()
+    return AnalyticsBundle(
+        stats=stats,
+        items=items,
+        time_series=_bucket_counts(published_at, granularity),
+        trending=[ContentItemResponse.model_validate(item) for item in trending],
+    )
+
+
+@router.get(
+    "/analytics",
+    response_model=AnalyticsBundle,
+    summary="Get the analytics bundle",
+    description="Retrieve the statistics, recent items, item time series and trending items of an analytics "
+    "view in one request, instead of one request per endpoint.",
+)
+async def get_analytics_bundle(
+    response: Response,
+    window: str = Query(
+        "24h",
+        description="Time window for new items and trending analysis. Format: number + unit (h=hours, d=days, w=weeks)",
+        examples=["24h"],
+    ),
+    sources: list[str] | None = Query(
+        None,
+        description="Filter statistics, items and trending items by source names",
+        examples=[["hackernews"]],
+    ),
+    q: str | None = Query(
+        None,
+        description="Search query that matches against both item titles and content of the recent items",
+        examples=["artificial intelligence"],
+    ),
+    items_limit: int = Query(1000, ge=1, le=1000, description="Maximum number of recent items", examples=[1000]),
+    fields: list[str] | None = Query(
+        None,
+        description="Item fields to return for the recent items, instead of the full items with their source",
+        examples=[["id", "title", "score", "published_at"]],
+    ),
+    trending_limit: int = Query(20, ge=1, le=100, description="Maximum number of trending items", examples=[20]),
+    granularity: str = Query("hour", pattern="^(hour|day)$", description="Time series bucket size"),
+    accept: str | None = Header(None, include_in_schema=False),
+    db: AsyncSession = Depends(get_db),
+    cache_info: CacheInfo = Depends(cache_dependency),
+) -> AnalyticsBundle | Response:
+    """
+    Get everything the dashboard's analytics view shows in one response.
+
+    The queries run one after another on the request's database session, sharing its
+    connection and the parsed window, so the dashboard makes one round trip per load
+    instead of one per endpoint.
+
+    Args:
+        window: Time window for new items and trending items (e.g., '24h', '7d', '1w')
+        sources: Optional filter by source names
+        q: Optional search query for the recent items
+        items_limit: Number of recent items to return (1-1000)
+        fields: Optional item fields to limit the recent items to
+        trending_limit: Number of trending items to return (1-100)
+        granularity: Time series bucket size, 'hour' or 'day'
+        accept: Accept header; projected items are sent as an Arrow IPC stream when it
+            names application/vnd.apache.arrow.stream
+        db: Database session dependency
+
+    Returns:
+        AnalyticsBundle with statistics, recent items, their time series and trending items,
+        or the same bundle as an Arrow IPC stream
+    """
+    try:
+        window_delta = _parse_window(window)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if fields and not _ITEM_FIELDS.issuperset(fields):
+        unknown = ", ".join(sorted(set(fields) - _ITEM_FIELDS))
+        raise HTTPException(status_code=400, detail=f"Unknown item fields: {unknown}")
+
+    window_start = datetime.now(UTC) - window_delta
+    bundle = await _build_analytics_bundle(
+        db,
+        window_start,
+        sources,
+        q,
+        items_limit,
+        fields,
+        trending_limit,
+        granularity,
+    )
+
+    # Projected items are tabular and can travel as Arrow record batches instead of JSON
+    if _bundle_media_type(fields, accept) == ARROW_STREAM_MEDIA_TYPE:
+        arrow_response = Response(content=_arrow_bundle(bundle), media_type=ARROW_STREAM_MEDIA_TYPE)
+        set_cache_headers(arrow_response, cache_info)
+        return arrow_response
 
     # Set cache headers
     set_cache_headers(response, cache_info)
 
-    # Convert to response schemas
-    return [ContentItemResponse.model_validate(item) for item in items]
+    return bundle
@@ -16,6 +16,10 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://DataSeed:dev_password@db/DataSeed_DB"
     CELERY_BROKER_URL: str | None = None
     CELERY_RESULT_BACKEND: str | None = None
+    CELERY_WORKER_POOL: str = "threads"
+    CELERY_WORKER_CONCURRENCY: int = 32
+    # Port for the worker's Prometheus metrics endpoint; unset disables it
+    CELERY_WORKER_METRICS_PORT: int | None = None
     REDDIT_CLIENT_ID: str | None = None
     REDDIT_CLIENT_SECRET: str | None = None
     GITHUB_TOKEN: str | None = None
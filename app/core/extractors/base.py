@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from types import TracebackType
 from typing import Any, Protocol
 
-from pydantic import BaseModel
+import httpx
+from pydantic import BaseModel, ConfigDict
 
 from app.core.http_client import RateLimitedClient
 
@@ -23,9 +25,13 @@ class RawItem(BaseModel):
 class ExtractorConfig(BaseModel):
     """Configuration for extractors."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     base_url: str
     rate_limit: int
     config: dict[str, Any]
+    # Optional connection pool shared with other extractors; owned by the caller
+    transport: httpx.AsyncBaseTransport | None = None
 
 
 class BaseExtractor(ABC):
@@ -51,6 +57,7 @@ class BaseExtractor(ABC):
             retries=client_config.get("retries", 3),
             semaphore_size=client_config.get("semaphore_size", 10),
             timeout=client_config.get("timeout", 10.0),
+            transport=self.config.transport,
         )
 
     @abstractmethod
@@ -85,6 +92,23 @@ class BaseExtractor(ABC):
         """
         pass
 
+    async def stream_recent(self, since: datetime | None = None, limit: int = 100) -> AsyncIterator[RawItem]:
+        """
+        Stream recent items from the source one at a time.
+
+        The default implementation yields the result of fetch_recent. Extractors that
+        can produce items incrementally may override it to avoid building the full list.
+
+        Args:
+            since: Only fetch items published after this datetime
+            limit: Maximum number of items to fetch
+
+        Yields:
+            Raw items from the source
+        """
+        for item in await self.fetch_recent(since=since, limit=limit):
+            yield item
+
     @abstractmethod
     async def fetch_batch(self, limit: int = 100) -> list[RawItem]:
         """
@@ -114,6 +138,8 @@ class ExtractorProtocol(Protocol):
 
     async def fetch_recent(self, since: datetime | None = None, limit: int = 100) -> list[RawItem]: ...
 
+    def stream_recent(self, since: datetime | None = None, limit: int = 100) -> AsyncIterator[RawItem]: ...
+
     async def fetch_batch(self, limit: int = 100) -> list[RawItem]: ...
 
     async def health_check(self) -> bool: ...
@@ -1,9 +1,39 @@
 import asyncio
+import weakref
 from typing import Any
 
 import httpx
 from loguru import logger
 
+# Connection pools shared by every client on the same event loop, so keep-alive
+# connections (and their DNS/TCP/TLS setup) survive across ingestion tasks
+SHARED_TRANSPORT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+_SHARED_TRANSPORTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Get the connection-pooling transport shared on the running event loop.
+
+    Returns:
+        Transport to pass to RateLimitedClient
+    """
+    loop = asyncio.get_running_loop()
+    transport = _SHARED_TRANSPORTS.get(loop)
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(limits=SHARED_TRANSPORT_LIMITS)
+        _SHARED_TRANSPORTS[loop] = transport
+    return transport
+
+
+async def close_shared_transport() -> None:
+    """Close the shared transport of the running event loop, if one was created."""
+    transport = _SHARED_TRANSPORTS.pop(asyncio.get_running_loop(), None)
+    if transport is not None:
+        await transport.aclose()
+
 
 class RateLimitedClient:
     """
@@ -23,6 +53,7 @@ class RateLimitedClient:
         max_keepalive_connections: int = 5,
         user_agent: str = "DataSeed/1.0",
         headers: dict[str, str] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """
         Initialize the rate-limited HTTP client.
@@ -36,6 +67,8 @@ class RateLimitedClient:
             max_keepalive_connections: Maximum number of keepalive connections
             user_agent: User-Agent header value
             headers: Additional headers to include in requests
+            transport: Shared transport to send requests through; it is not closed
+                with this client and connection limits come from the transport
         """
         self.rate_limit = rate_limit
         self.request_delay = 60 / rate_limit if rate_limit > 0 else 0.0
@@ -47,6 +80,7 @@ class RateLimitedClient:
         self.timeout = timeout
         self.max_connections = max_connections
         self.max_keepalive_connections = max_keepalive_connections
+        self.transport = transport
 
         # Default headers
         self.default_headers = {
@@ -66,6 +100,7 @@ class RateLimitedClient:
                     max_keepalive_connections=self.max_keepalive_connections,
                 ),
                 headers=self.default_headers,
+                transport=self.transport,
             )
         return self.client
 
@@ -211,9 +246,10 @@ class RateLimitedClient:
         return None
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client, leaving a shared transport open for other clients."""
         if self.client:
-            await self.client.aclose()
+            if self.transport is None:
+                await self.client.aclose()
             self.client = None
 
     async def __aenter__(self) -> "RateLimitedClient":
@@ -73,6 +73,30 @@ class BaseNormalizer[InputType: BaseModel, OutputType: BaseModel](ABC):
         logger.info(f"Normalized {len(normalized_items)} items, {failed_count} failed")
         return normalized_items
 
+    def normalize_many(self, raw_items: list[InputType]) -> tuple[list[OutputType], list[tuple[str | None, str]]]:
+        """
+        Normalize a batch of raw items in one call, collecting failures instead of logging them.
+
+        Subclasses can override this to hoist per-batch invariants out of the item loop.
+
+        Args:
+            raw_items: List of raw items to normalize
+
+        Returns:
+            Tuple of (normalized items, (external_id, truncated error) for each failed item)
+        """
+        normalize = self.normalize
+        normalized_items = []
+        failures = []
+
+        for raw_item in raw_items:
+            try:
+                normalized_items.append(normalize(raw_item))
+            except Exception as e:
+                failures.append((getattr(raw_item, "external_id", None), str(e)[:200]))
+
+        return normalized_items, failures
+
     def _clean_text(self, text: str | None) -> str | None:
         """
         Clean and normalize text content.
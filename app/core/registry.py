@@ -6,6 +6,7 @@ allowing new extractors and normalizers to be added without modifying existing f
 """
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -58,6 +59,8 @@ def register_normalizer(name: str) -> Callable[[type["BaseNormalizer"]], type["B
 
     def decorator(cls: type["BaseNormalizer"]) -> type["BaseNormalizer"]:
         normalizer_registry[name] = cls
+        # Cached instances may resolve to a class this registration replaces
+        get_normalizer.cache_clear()
         return cls
 
     return decorator
@@ -141,10 +144,14 @@ def get_extractor(source_name: str, config: "ExtractorConfig", source_id: int) -
     return extractor_class(config, source_id=source_id)
 
 
+@lru_cache(maxsize=64)
 def get_normalizer(source_name: str, source_id: int) -> "BaseNormalizer":
     """
     Factory function to get a normalizer instance for a source.
 
+    Normalizers hold no per-task state, so instances are memoized per
+    (source_name, source_id) and shared between tasks in the same worker.
+
     Args:
         source_name: Name of the data source
         source_id: ID of the data source
@@ -9,7 +9,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from loguru import logger
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import and_, case, func, insert, literal_column, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
@@ -19,6 +19,26 @@ from app.models.ingestion import IngestionRun
 from app.models.items import ContentItem
 from app.schemas.items import ContentItemCreate
 
+# Finished runs whose completion time is safe to resume ingestion from
+WATERMARK_RUN_STATUSES = ("completed", "partial")
+
+
+def resolve_run_status(errors: int, items_written: int = 0) -> str:
+    """
+    Determine the final status of a finished ingestion run.
+
+    Args:
+        errors: Total number of errors encountered during the run
+        items_written: Number of items inserted or updated by the run
+
+    Returns:
+        'completed' if the run had no errors, 'partial' if it had errors but still
+        wrote items, 'failed' otherwise
+    """
+    if errors == 0:
+        return "completed"
+    return "partial" if items_written > 0 else "failed"
+
 
 class IngestionService:
     """Service for handling data ingestion operations with proper tracking."""
@@ -29,6 +49,9 @@ class IngestionService:
     async def batch_upsert_items(
         self,
         items: list[ContentItemCreate],
+        run_id: int | None = None,
+        run_errors: int = 0,
+        prior_stats: dict[str, int] | None = None,
     ) -> dict[str, int]:
         """
         Perform batch upsert of content items with conflict resolution.
@@ -36,8 +59,16 @@ class IngestionService:
         Uses database-specific ON CONFLICT DO UPDATE to handle duplicates based on
         the unique constraint (source_id, external_id). Supports PostgreSQL and SQLite.
 
+        When a run_id is given, the ingestion run is finalized with the upsert
+        statistics in the same transaction, saving a separate UPDATE and commit.
+        The run is left untouched if there is nothing to upsert or the upsert fails.
+
         Args:
             items: List of ContentItemCreate objects to upsert
+            run_id: Optional ID of the ingestion run to finalize alongside the upsert
+            run_errors: Errors that occurred before the upsert (e.g. normalization)
+            prior_stats: Counts ('processed', 'new', 'updated') from earlier chunks of the
+                same run, added to this batch's counts when finalizing the run
 
         Returns:
             Dict with counts: {'new': int, 'updated': int, 'failed': int}
@@ -78,8 +109,12 @@ class IngestionService:
                     "updated_at": stmt.excluded.updated_at,
                 }
 
-                # Create the ON CONFLICT DO UPDATE statement
-                upsert_stmt = stmt.on_conflict_do_update(constraint="uq_source_external", set_=update_dict)
+                # Create the ON CONFLICT DO UPDATE statement. xmax is 0 only for freshly
+                # inserted rows, so new vs updated is known without a separate query.
+                upsert_stmt = stmt.on_conflict_do_update(constraint="uq_source_external", set_=update_dict).returning(
+                    ContentItem.id,
+                    literal_column("(xmax = 0)").label("inserted"),
+                )
 
             elif dialect == "sqlite":
                 stmt = sqlite_insert(ContentItem).values(items_data)
@@ -100,28 +135,35 @@ class IngestionService:
             else:
                 raise NotImplementedError(f"Batch upsert not supported for dialect: {dialect}")
 
-            # Pre-count existing items before executing the upsert
-            pairs = [(item["source_id"], item["external_id"]) for item in items_data]
-            existing_count = 0
-            if pairs:
-                conditions = [
-                    and_(
-                        ContentItem.source_id == source_id,
-                        ContentItem.external_id == external_id,
-                    )
-                    for source_id, external_id in pairs
-                ]
-                pre_count_stmt = select(func.count()).select_from(ContentItem).where(or_(*conditions))
-                existing_count = (await self.db.execute(pre_count_stmt)).scalar() or 0
-
-            # Execute the upsert and get results
-            result = await self.db.execute(upsert_stmt)
-            await self.db.commit()
+            if dialect == "postgresql":
+                # Execute the upsert and classify each returned row as inserted or updated
+                result = await self.db.execute(upsert_stmt)
+                rows = result.all()
+                new = sum(1 for row in rows if row.inserted)
+                updated = len(rows) - new
 
-            # Calculate stats correctly
-            affected = result.rowcount or 0
-            updated = min(existing_count, affected)
-            new = max(0, affected - updated)  # Use max to prevent negative numbers
+            else:
+                # Pre-count existing items before executing the upsert
+                pairs = [(item["source_id"], item["external_id"]) for item in items_data]
+                existing_count = 0
+                if pairs:
+                    conditions = [
+                        and_(
+                            ContentItem.source_id == source_id,
+                            ContentItem.external_id == external_id,
+                        )
+                        for source_id, external_id in pairs
+                    ]
+                    pre_count_stmt = select(func.count()).select_from(ContentItem).where(or_(*conditions))
+                    existing_count = (await self.db.execute(pre_count_stmt)).scalar() or 0
+
+                # Execute the upsert and get results
+                result = await self.db.execute(upsert_stmt)
+
+                # Calculate stats correctly
+                affected = result.rowcount or 0
+                updated = min(existing_count, affected)
+                new = max(0, affected - updated)  # Use max to prevent negative numbers
 
             stats = {
                 "new": new,
@@ -129,6 +171,27 @@ class IngestionService:
                 "failed": 0,  # No failures if we reach here
             }
 
+            if run_id is not None:
+                prior = prior_stats or {}
+                run_new = new + prior.get("new", 0)
+                run_updated = updated + prior.get("updated", 0)
+                finish_stmt = (
+                    update(IngestionRun)
+                    .where(IngestionRun.id == run_id)
+                    .values(
+                        status=resolve_run_status(run_errors, run_new + run_updated),
+                        items_processed=len(items) + prior.get("processed", 0),
+                        items_new=run_new,
+                        items_updated=run_updated,
+                        items_failed=run_errors,
+                        errors_count=run_errors,
+                        completed_at=datetime.now(UTC),
+                    )
+                )
+                await self.db.execute(finish_stmt)
+
+            await self.db.commit()
+
             logger.info(
                 f"Batch upsert completed: {stats['new']} new, {stats['updated']} updated, {stats['failed']} failed",
             )
@@ -175,6 +238,95 @@ class IngestionService:
             logger.error(f"Failed to create ingestion run: {str(e)}")
             raise
 
+    async def create_running_run(self, source_id: int, started_at: datetime | None = None) -> int:
+        """
+        Create an ingestion run already in the 'running' state and return its ID.
+
+        Uses a single INSERT ... RETURNING id, without loading the row back into the session.
+
+        Args:
+            source_id: ID of the source being ingested
+            started_at: When the run started (defaults to now)
+
+        Returns:
+            ID of the created ingestion run
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if started_at is None:
+            started_at = datetime.now(UTC)
+
+        try:
+            stmt = (
+                insert(IngestionRun)
+                .values(source_id=source_id, started_at=started_at, status="running")
+                .returning(IngestionRun.id)
+            )
+            run_id = (await self.db.execute(stmt)).scalar_one()
+            await self.db.commit()
+
+            logger.info(f"Created running ingestion run with ID={run_id}")
+            return run_id
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Failed to create ingestion run: {str(e)}")
+            raise
+
+    async def finish_ingestion_run(
+        self,
+        run_id: int,
+        status: str,
+        items_processed: int | None = None,
+        items_new: int | None = None,
+        items_updated: int | None = None,
+        items_failed: int | None = None,
+        errors_count: int | None = None,
+        error_notes: str | None = None,
+        completed_at: datetime | None = None,
+    ) -> None:
+        """
+        Close an ingestion run with a single UPDATE, without loading the row first.
+
+        Args:
+            run_id: ID of the ingestion run to close
+            status: Final status ('completed', 'partial' or 'failed')
+            items_processed: Total number of items processed
+            items_new: Number of new items created
+            items_updated: Number of existing items updated
+            items_failed: Number of items that failed processing
+            errors_count: Total number of errors encountered
+            error_notes: Detailed error information
+            completed_at: When the run completed (defaults to now)
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        values = {
+            "items_processed": items_processed,
+            "items_new": items_new,
+            "items_updated": items_updated,
+            "items_failed": items_failed,
+            "errors_count": errors_count,
+            "error_notes": error_notes,
+        }
+        values = {key: value for key, value in values.items() if value is not None}
+
+        try:
+            stmt = (
+                update(IngestionRun)
+                .where(IngestionRun.id == run_id)
+                .values(status=status, completed_at=completed_at or datetime.now(UTC), **values)
+            )
+            await self.db.execute(stmt)
+            await self.db.commit()
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Failed to finish ingestion run ID={run_id}: {str(e)}")
+            raise
+
     async def update_ingestion_run(
         self,
         run_id: int,
@@ -250,7 +402,7 @@ class IngestionService:
                 ingestion_run.notes = existing_notes
 
             # Auto-set completed_at if status indicates completion
-            if status in ("completed", "failed") and completed_at is None:
+            if status in ("completed", "partial", "failed") and completed_at is None:
                 completed_at = datetime.now(UTC)
 
             if completed_at is not None:
@@ -280,7 +432,9 @@ class IngestionService:
         notes: dict[str, Any] | None = None,
     ) -> IngestionRun | None:
         """
-        Mark an ingestion run as completed with final statistics.
+        Mark an ingestion run as finished with final statistics.
+
+        Item failures make the run 'partial' if it still wrote items, 'failed' otherwise.
 
         Args:
             run_id: ID of the ingestion run
@@ -293,7 +447,7 @@ class IngestionService:
             Updated IngestionRun instance or None if not found
         """
         total_processed = sum(upsert_stats.values())
-        status = "completed" if upsert_stats["failed"] == 0 else "failed"
+        status = resolve_run_status(upsert_stats["failed"], upsert_stats["new"] + upsert_stats["updated"])
 
         return await self.update_ingestion_run(
             run_id=run_id,
@@ -1,4 +1,7 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
@@ -10,3 +13,24 @@ SessionLocal = sessionmaker(
     autoflush=False,
     expire_on_commit=False,
 )
+
+
+def create_worker_engine() -> AsyncEngine:
+    """
+    Create the database engine for a Celery worker process.
+
+    Each worker thread holds a task session and may open a second connection for detached
+    bookkeeping writes, so the pool serves twice the worker concurrency. Connections are
+    opened lazily, so a worker with fewer concurrent tasks never opens that many.
+    SQLite engines use a single-connection or file pool that takes no sizing arguments.
+
+    Returns:
+        AsyncEngine: Engine with a pool sized for the worker's thread pool
+    """
+    pool_options: dict[str, Any] = {}
+    if make_url(settings.DATABASE_URL).get_backend_name() != "sqlite":
+        pool_options = {
+            "pool_size": settings.CELERY_WORKER_CONCURRENCY,
+            "max_overflow": settings.CELERY_WORKER_CONCURRENCY,
+        }
+    return create_async_engine(settings.DATABASE_URL, pool_pre_ping=True, **pool_options)
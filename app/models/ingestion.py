@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, desc
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, desc, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -11,6 +11,14 @@ class IngestionRun(Base, TimestampMixin):
     __table_args__ = (
         Index("ix_ingestion_runs_source_id_started_at_desc", "source_id", desc("started_at")),
         Index("ix_ingestion_runs_status_started_at_desc", "status", desc("started_at")),
+        # Serves the per-source "last completed run" lookup used to compute ingestion windows
+        Index(
+            "ix_ingestion_runs_last_completed",
+            "source_id",
+            desc("completed_at"),
+            postgresql_where=text("status IN ('completed', 'partial')"),
+            sqlite_where=text("status IN ('completed', 'partial')"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -49,6 +57,11 @@ class IngestionRun(Base, TimestampMixin):
         """Check if the ingestion run completed successfully."""
         return self.status == "completed"
 
+    @property
+    def is_partial(self) -> bool:
+        """Check if the ingestion run finished with some items failing."""
+        return self.status == "partial"
+
     @property
     def is_failed(self) -> bool:
         """Check if the ingestion run failed."""
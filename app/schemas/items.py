@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -76,3 +77,21 @@ class ItemsStats(BaseModel):
     top_sources: list[SourceStat] = Field(description="Top sources by item count")
     max_score: float | None = Field(default=None, description="Maximum score among items")
     avg_score: float | None = Field(default=None, description="Average score among items")
+
+
+class TimeSeriesPoint(BaseModel):
+    """Schema for the item count of one time series bucket."""
+
+    timestamp: datetime = Field(description="Start of the bucket")
+    count: int = Field(description="Number of items published in the bucket")
+
+
+class AnalyticsBundle(BaseModel):
+    """Schema for the analytics bundle response."""
+
+    stats: ItemsStats = Field(description="Items statistics")
+    items: list[ContentItemResponse] | list[dict[str, Any]] = Field(
+        description="Most recent items, newest first; only the requested fields when projected",
+    )
+    time_series: list[TimeSeriesPoint] = Field(description="Item counts over time of the most recent items")
+    trending: list[ContentItemResponse] = Field(description="Trending items ranked by score")
@@ -1,8 +1,62 @@
+import asyncio
+import os
+import sys
+import threading
+from collections.abc import Coroutine
+from typing import Any
+
 from celery import Celery, Task
-from sqlalchemy.ext.asyncio import AsyncSession
+from celery.signals import worker_init, worker_process_init
+from loguru import logger
+from prometheus_client import start_http_server
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.config import settings
-from app.database import engine
+from app.database import create_worker_engine, engine
+
+# One long-lived event loop per worker process, run in a daemon thread. Tasks submit their
+# coroutines to it instead of creating a loop (and a thread pool) per invocation, which also
+# keeps pooled async DB connections on the loop that created them.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+_loop_lock = threading.Lock()
+
+# Engine behind task sessions. A starting worker swaps in one whose pool is sized for its
+# thread pool; processes that only import the app, like the API, keep the shared engine.
+_task_engine: AsyncEngine = engine
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the worker's background event loop, starting it on first use.
+
+    The loop is recreated in forked children, since the parent's loop thread
+    does not survive the fork.
+
+    Returns:
+        The running background event loop
+    """
+    global _loop, _loop_pid
+
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(target=_loop.run_forever, name="worker-event-loop", daemon=True).start()
+        return _loop
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the worker's background event loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
 
 
 class DBSessionTask(Task):
@@ -12,9 +66,20 @@ class DBSessionTask(Task):
     This class implements the Dependency Inversion Principle by providing
     a managed database session that is automatically created and cleaned up
     for each task execution.
+
+    Task instances are shared by every pool thread, so the session is kept
+    thread-local: concurrent executions each get their own session.
     """
 
-    _db_session = None
+    _local = threading.local()
+
+    @property
+    def _db_session(self) -> AsyncSession | None:
+        return getattr(self._local, "db_session", None)
+
+    @_db_session.setter
+    def _db_session(self, session: AsyncSession | None) -> None:
+        self._local.db_session = session
 
     def after_return(self, status, retval, task_id, args, kwargs, einfo):
         """
@@ -24,21 +89,9 @@ class DBSessionTask(Task):
         It ensures that the database session is properly closed to prevent connection leaks.
         """
         if self._db_session:
-            # For async sessions, we need to run the close in an event loop
-            import asyncio
-
+            # Close on the same loop the session's connection was used on
             try:
-                # Try to get the current event loop
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is running, schedule the close as a task
-                    loop.create_task(self._db_session.close())
-                else:
-                    # If no loop is running, run it directly
-                    loop.run_until_complete(self._db_session.close())
-            except RuntimeError:
-                # No event loop available, create a new one
-                asyncio.run(self._db_session.close())
+                run_async(self._db_session.close())
             finally:
                 self._db_session = None
 
@@ -51,7 +104,7 @@ class DBSessionTask(Task):
             AsyncSession: Database session instance
         """
         if self._db_session is None:
-            self._db_session = AsyncSession(engine)
+            self._db_session = AsyncSession(_task_engine)
         return self._db_session
 
 
@@ -72,12 +125,47 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # Tasks are I/O bound and run their coroutines on the shared worker event loop, so
+    # a thread pool gives many concurrent ingestions per process
+    worker_pool=settings.CELERY_WORKER_POOL,
+    worker_concurrency=settings.CELERY_WORKER_CONCURRENCY,
+    # Reserve one message at a time and ack only after the task ran, so a slow source never
+    # holds siblings back behind it and a killed worker's ingestion is redelivered. Runs are
+    # keyed by their own row, so a redelivered ingestion simply starts a new run.
     worker_prefetch_multiplier=1,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     task_track_started=True,
 )
 
+
+@worker_init.connect
+@worker_process_init.connect
+def configure_worker_logging(**kwargs: object) -> None:
+    """
+    Route loguru output through a queue drained by a background thread.
+
+    Task code then only enqueues records instead of formatting and writing them under
+    the sink lock. Re-run in each forked pool process so its queue thread is its own.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=settings.LOG_LEVEL, enqueue=True)
+
+
+@worker_init.connect
+def configure_worker_engine(**kwargs: object) -> None:
+    """Give task sessions an engine whose pool is sized for the worker's thread pool."""
+    global _task_engine
+    _task_engine = create_worker_engine()
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs: object) -> None:
+    """Expose the ingestion metrics over HTTP when a metrics port is configured."""
+    if settings.CELERY_WORKER_METRICS_PORT:
+        start_http_server(settings.CELERY_WORKER_METRICS_PORT)
+
+
 # Configure Celery Beat schedule for periodic tasks
 celery_app.conf.beat_schedule = {
     "schedule-all-sources": {
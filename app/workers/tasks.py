@@ -8,20 +8,98 @@ to create extractors and normalizers dynamically based on source names.
 """
 
 import asyncio
-import concurrent.futures
+import itertools
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import Any
 
-from celery import shared_task
+from celery import group
+from celery.signals import worker_process_shutdown, worker_shutdown
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, Row, Select, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
 
-from app.core.extractors.base import ExtractorConfig
+from app.core.extractors.base import ExtractorConfig, RawItem
+from app.core.http_client import close_shared_transport, get_shared_transport
 from app.core.registry import get_extractor, get_normalizer
-from app.core.services.ingestion import IngestionService
+from app.core.services.ingestion import WATERMARK_RUN_STATUSES, IngestionService, resolve_run_status
+from app.models.ingestion import IngestionRun
 from app.models.source import Source
-from app.workers.celery_app import celery_app
+from app.schemas.items import ContentItemCreate
+from app.workers.celery_app import DBSessionTask, celery_app, run_async
+from app.workers.metrics import INGEST_DURATION, record_ingestion
+
+
+@dataclass(frozen=True, slots=True)
+class SourceSnapshot:
+    """Immutable copy of the source fields an ingestion run needs."""
+
+    id: int
+    name: str
+    base_url: str
+    rate_limit: int
+    config: dict
+
+    @classmethod
+    def from_row(cls, row: Row) -> "SourceSnapshot":
+        return cls(
+            id=row.id,
+            name=row.name,
+            base_url=row.base_url,
+            rate_limit=row.rate_limit,
+            config=row.config,
+        )
+
+
+# Sources change on the order of hours while ingestion tasks fire every few minutes,
+# so lookups are memoized per worker process for a short TTL.
+SOURCE_CACHE_TTL_SECONDS = 300.0
+_SOURCE_CACHE: dict[str | int, tuple[float, SourceSnapshot]] = {}
+
+
+def _last_completed_query(source_id: int | ColumnElement[int]) -> Select:
+    return select(func.max(IngestionRun.completed_at)).where(
+        IngestionRun.source_id == source_id,
+        # Statuses are rendered inline so the planner can match the partial index predicate
+        IngestionRun.status.in_(bindparam("watermark_statuses", WATERMARK_RUN_STATUSES, literal_execute=True)),
+    )
+
+
+# Lookup statements run on every ingestion task, so they are built once here and
+# executed with bound parameters instead of being reconstructed per call. Sources are
+# read as plain columns: the snapshot needs no ORM instance or identity-map entry.
+_SOURCE_SNAPSHOT_COLUMNS = (Source.id, Source.name, Source.base_url, Source.rate_limit, Source.config)
+_STMT_SOURCE_BY_ID = select(*_SOURCE_SNAPSHOT_COLUMNS).where(
+    Source.id == bindparam("identifier"),
+    Source.is_active.is_(True),
+)
+_STMT_SOURCE_BY_NAME = select(*_SOURCE_SNAPSHOT_COLUMNS).where(
+    Source.name == bindparam("identifier"),
+    Source.is_active.is_(True),
+)
+_STMT_LAST_COMPLETED = _last_completed_query(bindparam("source_id"))
+_STMT_SOURCE_WITH_LAST_RUN_BY_ID = _STMT_SOURCE_BY_ID.add_columns(
+    _last_completed_query(Source.id).scalar_subquery().label("last_completed"),
+)
+_STMT_SOURCE_WITH_LAST_RUN_BY_NAME = _STMT_SOURCE_BY_NAME.add_columns(
+    _last_completed_query(Source.id).scalar_subquery().label("last_completed"),
+)
+
+# Rows per INSERT ... ON CONFLICT statement, keeping each batch in PostgreSQL's efficient
+# range and well under its bind-parameter limit
+UPSERT_CHUNK_SIZE = 1000
+
+# Bounds for the per-run extractor limit derived from a source's expected item rate
+DEFAULT_FETCH_LIMIT = 100
+MIN_FETCH_LIMIT = 20
+MAX_FETCH_LIMIT = 1000
+
+# Bookkeeping writes scheduled off the critical path on the worker loop; drained at shutdown
+BACKGROUND_WRITE_TIMEOUT_SECONDS = 2.0
+_BACKGROUND_WRITES: set[asyncio.Task] = set()
 
 
 @celery_app.task(bind=True, name="ingest.source")
@@ -41,22 +119,24 @@ def ingest_source_task(self, source_identifier: str | int) -> dict[str, Any]:
     Returns:
         Dict with ingestion statistics: processed, new, updated counts
     """
-    logger.info(f"Starting {source_identifier} ingestion task")
+    return _run_ingestion(self, source_identifier)
 
-    try:
-        # Check if an event loop is already running in the current thread
-        asyncio.get_running_loop()
 
-        # If so, it's safer to run the new event loop in a separate thread
-        # to avoid conflicts.
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # We submit a lambda that calls asyncio.run(), ensuring a clean event loop.
-            future = executor.submit(lambda: asyncio.run(_ingest_source_async(self, source_identifier)))
-            result = future.result()
+def _run_ingestion(task_instance: DBSessionTask, source_identifier: str | int) -> dict[str, Any]:
+    """
+    Run the async ingestion pipeline for a source from a synchronous Celery task.
+
+    Args:
+        task_instance: The Celery task instance with db_session property
+        source_identifier: Name or ID of the source to ingest
+
+    Returns:
+        Dict with ingestion statistics: processed, new, updated counts
+    """
+    logger.debug(f"Starting {source_identifier} ingestion task")
 
-    except RuntimeError:
-        # If no event loop is running, we can safely start one.
-        result = asyncio.run(_ingest_source_async(self, source_identifier))
+    try:
+        result = run_async(_ingest_source_async(task_instance, source_identifier))
 
     except Exception as e:
         logger.error(f"{source_identifier} ingestion task failed: {e}", exc_info=True)
@@ -85,122 +165,181 @@ async def _ingest_source_async(task_instance, source_identifier: str | int) -> d
         Dict with ingestion statistics
     """
     session = task_instance.db_session
+    source_name = None
+    # Single wall-clock read shared by the since window and the run start
+    now = datetime.now(UTC)
+    started = time.perf_counter()
     try:
-        # 1) Locate source
-        source = await get_source_by_identifier(session, source_identifier)
+        # 1) Locate source and its last successful run in a single round trip
+        source, last_completed = await get_source_with_last_run(session, source_identifier)
         if not source:
             raise ValueError(f"{source_identifier} source not found in database")
 
+        source_id = source.id
+        source_name = source.name
+        extractor_config = ExtractorConfig(
+            base_url=source.base_url,
+            rate_limit=source.rate_limit,
+            config=source.config,
+            transport=get_shared_transport(),
+        )
+
         # 2) Determine since timestamp
-        since = await get_last_since(session, source.id)
-        if not since:
-            since = datetime.now(UTC) - timedelta(hours=24)
+        # Add a small buffer to avoid missing items at the boundary
+        since = last_completed - timedelta(minutes=5) if last_completed else now - timedelta(hours=24)
+
+        limit = _adaptive_fetch_limit(source.config, since, now)
 
-        logger.info(f"Fetching {source.name} items since {since}")
+        logger.debug(f"Fetching up to {limit} {source_name} items since {since}")
 
-        # 3) Start ingestion run
-        run_id = await _start_run(session, source.id)
+        # 3) Start ingestion run on its own session, overlapping the insert with the fetch
+        ingestion_service = IngestionService(session)
+        start_run_task = asyncio.create_task(
+            _write_detached(session.bind, partial(_start_run, source_id=source_id, started_at=now)),
+        )
 
         try:
-            # 4) Extract data using factory-created extractor
-            # Refresh the source object to avoid lazy loading issues
-            await session.refresh(source)
-
-            extractor_config = ExtractorConfig(
-                base_url=source.base_url,
-                rate_limit=source.rate_limit,
-                config=source.config,
-            )
+            # 4) Extract, passing through items that are already normalized
+            # Decided from the first item: an extractor yields either raw or normalized items
+            passthrough: bool | None = None
+            normalized_items: list[ContentItemCreate] = []
+            raw_items: list[RawItem] = []
+            failures: list[tuple[str | None, str]] = []
+            extracted_count = 0
+            # Paginated listings overlap, so keep only the first occurrence of each item
+            seen_external_ids: set[str] = set()
 
             # Use factory function to get the appropriate extractor
-            async with get_extractor(source.name, extractor_config, source_id=source.id) as extractor:
-                raw_items = await extractor.fetch_recent(since=since, limit=100)
-
-            logger.info(f"Extracted {len(raw_items)} raw items from {source.name}")
-
-            # 5) Normalize data using factory-created normalizer
-            from app.schemas.items import ContentItemCreate
-
-            if raw_items and isinstance(raw_items[0], ContentItemCreate):
-                # This case should ideally not happen if extractors always return RawItem
-                normalized_items = raw_items
-                normalization_errors = 0
-                logger.info("Items are already normalized, skipping normalization step")
-            else:
-                normalizer = get_normalizer(source.name, source.id)
-                normalized_items = []
-                normalization_errors = 0
-
-                for raw_item in raw_items:
-                    try:
-                        normalized_item = normalizer.normalize(raw_item)
-                        normalized_items.append(normalized_item)
-                    except Exception as e:
-                        item_id = getattr(raw_item, "external_id", "unknown")
-                        logger.warning(f"Failed to normalize item {item_id}: {e}")
-                        normalization_errors += 1
-                logger.info(f"Normalized {len(normalized_items)} items ({normalization_errors} errors)")
-
-            # 6) Upsert to database using service instantiated within task
-            ingestion_service = IngestionService(session)
-            upsert_stats = await ingestion_service.batch_upsert_items(
-                [item for item in normalized_items if isinstance(item, ContentItemCreate)],
+            async with get_extractor(source_name, extractor_config, source_id=source_id) as extractor:
+                async for raw_item in extractor.stream_recent(since=since, limit=limit):
+                    extracted_count += 1
+                    if raw_item.external_id in seen_external_ids:
+                        continue
+                    seen_external_ids.add(raw_item.external_id)
+
+                    if passthrough is None:
+                        # Some extractors (e.g. GitHub) already return normalized items
+                        passthrough = isinstance(raw_item, ContentItemCreate)
+
+                    if passthrough:
+                        normalized_items.append(raw_item)
+                    else:
+                        raw_items.append(raw_item)
+
+            run_id = await start_run_task
+
+            # 5) Normalize the raw items in a single batch call
+            if raw_items:
+                normalizer = get_normalizer(source_name, source_id)
+                normalized_items, failures = normalizer.normalize_many(raw_items)
+            normalization_errors = len(failures)
+
+            if failures:
+                # One aggregated warning instead of a log line per failing item
+                logger.warning(
+                    f"Failed to normalize {len(failures)} {source_name} items; sample={failures[:5]}",
+                    extra={"count": len(failures), "sample": failures[:5]},
+                )
+
+            logger.debug(
+                f"Extracted {extracted_count} raw items from {source_name} "
+                f"({len(seen_external_ids)} after removing duplicates)",
             )
 
-            # 7) Complete ingestion run
-            await _finish_run(
-                session,
-                run_id,
-                items_processed=len(normalized_items),
-                items_new=upsert_stats["new"],
-                items_updated=upsert_stats["updated"],
-                errors=normalization_errors + upsert_stats["failed"],
-            )
+            # Fast path: nothing new since the last run, so only close the run
+            if not extracted_count:
+                _finish_run_in_background(session, run_id, items_processed=0, items_new=0, items_updated=0, errors=0)
+                logger.debug(f"No new items from {source_name}, skipping upsert")
+                result = {"processed": 0, "new": 0, "updated": 0, "errors": 0}
+                record_ingestion(source_name, result)
+                return result
+
+            logger.debug(f"Normalized {len(normalized_items)} items ({normalization_errors} errors)")
+
+            # 6) Upsert to database in bounded chunks; the last chunk also completes the
+            # ingestion run in its transaction
+            totals = {"processed": 0, "new": 0, "updated": 0, "failed": 0}
+            finalized = False
+            chunks = list(itertools.batched(normalized_items, UPSERT_CHUNK_SIZE))
+
+            for index, chunk in enumerate(chunks):
+                is_last = index == len(chunks) - 1
+                chunk_stats = await ingestion_service.batch_upsert_items(
+                    list(chunk),
+                    run_id=run_id if is_last else None,
+                    run_errors=normalization_errors + totals["failed"],
+                    prior_stats=totals if is_last else None,
+                )
+                finalized = is_last and not chunk_stats["failed"]
+
+                totals["processed"] += len(chunk)
+                totals["new"] += chunk_stats["new"]
+                totals["updated"] += chunk_stats["updated"]
+                totals["failed"] += chunk_stats["failed"]
+
+            # 7) Complete ingestion run separately if the upsert did not finalize it
+            if not finalized:
+                _finish_run_in_background(
+                    session,
+                    run_id,
+                    items_processed=totals["processed"],
+                    items_new=totals["new"],
+                    items_updated=totals["updated"],
+                    errors=normalization_errors + totals["failed"],
+                )
 
             result = {
-                "processed": len(normalized_items),
-                "new": upsert_stats["new"],
-                "updated": upsert_stats["updated"],
-                "errors": normalization_errors + upsert_stats["failed"],
+                "processed": totals["processed"],
+                "new": totals["new"],
+                "updated": totals["updated"],
+                "errors": normalization_errors + totals["failed"],
             }
 
-            logger.info(
-                f"{source.name} ingestion completed successfully",
-                extra={
-                    "source": source.name,
-                    "processed": result["processed"],
-                    "new": result["new"],
-                    "updated": result["updated"],
-                    "errors": result["errors"],
-                },
-            )
-
+            record_ingestion(source_name, result)
             return result
 
         except Exception as e:
-            # Mark run as failed
-            await _fail_run(session, run_id, str(e))
+            # Release whatever the failed unit of work holds, then record the failure on a
+            # separate session in the background so the error propagates without waiting on it
+            await session.rollback()
+            await asyncio.wait({start_run_task})
+            if start_run_task.exception() is None:
+                _spawn_background_write(
+                    _write_detached(
+                        session.bind,
+                        partial(
+                            _fail_run,
+                            run_id=start_run_task.result(),
+                            error_message=str(e),
+                            completed_at=datetime.now(UTC),
+                        ),
+                    ),
+                )
             raise
 
     except Exception as e:
-        logger.error(f"{(source.name if source else source_identifier)} ingestion failed: {e}", exc_info=True)
+        logger.error(f"{source_name or source_identifier} ingestion failed: {e}", exc_info=True)
         raise
 
+    finally:
+        if source_name:
+            INGEST_DURATION.labels(source_name).observe(time.perf_counter() - started)
+
 
 # Backward compatibility task for HackerNews
-@shared_task(name="ingest.hackernews")
-def ingest_hackernews_task() -> dict[str, Any]:
+@celery_app.task(bind=True, name="ingest.hackernews")
+def ingest_hackernews_task(self: DBSessionTask) -> dict[str, Any]:
     """
     Backward compatibility wrapper for HackerNews ingestion.
 
-    This task is kept for backward compatibility but delegates to the generic
-    ingest_source_task with "hackernews" as the source name.
+    This task is kept for backward compatibility and runs the same pipeline as
+    ingest_source_task with "hackernews" as the source name, directly in this
+    task instead of through an eager apply().
 
     Returns:
         Dict with ingestion statistics: processed, new, updated counts
     """
-    # Use the celery_app.task decorator to call the bound task properly
-    return ingest_source_task.apply(args=["hackernews"]).get()
+    return _run_ingestion(self, "hackernews")
 
 
 @celery_app.task(bind=True, name="schedule.all_sources")
@@ -218,17 +357,7 @@ def schedule_all_sources_task(self) -> dict[str, Any]:
     logger.info("Starting scheduled ingestion for all active sources")
 
     try:
-        # Check if an event loop is already running in the current thread
-        asyncio.get_running_loop()
-
-        # If so, run in a separate thread to avoid conflicts
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(lambda: asyncio.run(_schedule_all_sources_async(self)))
-            result = future.result()
-
-    except RuntimeError:
-        # If no event loop is running, we can safely start one
-        result = asyncio.run(_schedule_all_sources_async(self))
+        result = run_async(_schedule_all_sources_async(self))
 
     except Exception as e:
         logger.error(f"Failed to schedule source ingestion tasks: {e}", exc_info=True)
@@ -253,28 +382,32 @@ async def _schedule_all_sources_async(task_instance) -> dict[str, Any]:
     session = task_instance.db_session
 
     try:
-        # Query all active sources
-        stmt = select(Source).where(Source.is_active.is_(True))
+        # Query the names of all active sources; scheduling needs nothing else
+        stmt = select(Source.name).where(Source.is_active.is_(True))
         result = await session.execute(stmt)
-        active_sources = result.scalars().all()
+        active_source_names = result.scalars().all()
 
-        logger.info(f"Found {len(active_sources)} active sources")
+        logger.info(f"Found {len(active_source_names)} active sources")
 
         tasks_scheduled = 0
 
-        # Schedule ingestion task for each active source
-        for source in active_sources:
+        # Dispatch one ingestion task per active source as a single group so that
+        # all messages are published over one broker connection instead of N round trips.
+        # The publish is blocking socket I/O, so it runs off the event loop thread.
+        if active_source_names:
             try:
-                # Use apply_async to schedule the task without waiting for completion
-                ingest_source_task.apply_async(args=[source.name])
-                tasks_scheduled += 1
-                logger.info(f"Scheduled ingestion task for source: {source.name}")
+                job = group(ingest_source_task.s(name) for name in active_source_names)
+                group_result = await asyncio.to_thread(job.apply_async)
+                tasks_scheduled = len(group_result.results)
+                logger.info(
+                    f"Scheduled ingestion group {group_result.id} for sources: {list(active_source_names)}",
+                )
 
             except Exception as e:
-                logger.error(f"Failed to schedule ingestion for source {source.name}: {e}")
+                logger.error(f"Failed to schedule ingestion group for {len(active_source_names)} sources: {e}")
 
         return {
-            "sources_found": len(active_sources),
+            "sources_found": len(active_source_names),
             "tasks_scheduled": tasks_scheduled,
         }
 
@@ -283,72 +416,170 @@ async def _schedule_all_sources_async(task_instance) -> dict[str, Any]:
         raise
 
 
-async def get_source_by_identifier(session: AsyncSession, identifier: str | int) -> Source | None:
+def _adaptive_fetch_limit(config: dict | None, since: datetime, now: datetime) -> int:
     """
-    Get a source by name or ID from the database.
+    Size the extractor limit to the window since the last run.
+
+    Sources may declare ``expected_rate_per_min`` in their config; the limit is then
+    twice the items expected over the window, clamped to [MIN_FETCH_LIMIT, MAX_FETCH_LIMIT].
 
     Args:
-        session: Database session
-        identifier: Source name or ID to look up
+        config: Source configuration
+        since: Start of the fetch window
+        now: Current time
 
     Returns:
-        Source instance or None if not found
+        Maximum number of items to request from the extractor
     """
-    try:
-        if isinstance(identifier, int):
-            stmt = select(Source).where(Source.id == identifier, Source.is_active.is_(True))
-        else:
-            stmt = select(Source).where(Source.name == identifier, Source.is_active.is_(True))
+    rate = (config or {}).get("expected_rate_per_min")
+    if not rate:
+        return DEFAULT_FETCH_LIMIT
 
-        result = await session.execute(stmt)
-        return result.scalar_one_or_none()
-    except Exception as e:
-        logger.error(f"Failed to get source by identifier '{identifier}': {e}")
-        return None
+    if since.tzinfo is None:
+        # SQLite hands back naive datetimes; stored values are UTC
+        since = since.replace(tzinfo=UTC)
 
+    gap_minutes = max((now - since).total_seconds() / 60, 0)
+    return min(MAX_FETCH_LIMIT, max(MIN_FETCH_LIMIT, int(gap_minutes * float(rate) * 2)))
 
-async def get_last_since(session: AsyncSession, source_id: int) -> datetime | None:
+
+def _spawn_background_write(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
     """
-    Get the timestamp of the last successful ingestion for a source.
+    Schedule a bookkeeping write on the running loop without awaiting it.
 
     Args:
-        session: Database session
-        source_id: ID of the source
+        coro: Coroutine performing the write
 
     Returns:
-        Datetime of last successful ingestion or None
+        The scheduled task, tracked until it completes
     """
+    task = asyncio.create_task(coro)
+    _BACKGROUND_WRITES.add(task)
+    task.add_done_callback(_BACKGROUND_WRITES.discard)
+    return task
+
+
+async def drain_background_writes(timeout: float = BACKGROUND_WRITE_TIMEOUT_SECONDS) -> None:
+    """
+    Wait for pending background writes scheduled on the current loop.
+
+    Args:
+        timeout: Maximum number of seconds to wait
+    """
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _BACKGROUND_WRITES if task.get_loop() is loop]
+    if not pending:
+        return
+
     try:
-        from app.models.ingestion import IngestionRun
+        await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout=timeout)
+    except TimeoutError:
+        logger.warning(f"Timed out waiting for {len(pending)} background writes")
 
-        stmt = (
-            select(IngestionRun.completed_at)
-            .where(IngestionRun.source_id == source_id, IngestionRun.status == "completed")
-            .order_by(IngestionRun.completed_at.desc())
-            .limit(1)
-        )
 
-        result = await session.execute(stmt)
-        last_completed = result.scalar_one_or_none()
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def _drain_background_writes_on_shutdown(**kwargs: object) -> None:
+    """Give in-flight bookkeeping writes a chance to commit, then close pooled HTTP connections."""
+    run_async(_shutdown_worker_loop_resources())
+
+
+async def _shutdown_worker_loop_resources() -> None:
+    await drain_background_writes()
+    await close_shared_transport()
+
 
-        if last_completed:
-            # Add a small buffer to avoid missing items at the boundary
-            return last_completed - timedelta(minutes=5)
+def _get_cached_source(identifier: str | int) -> SourceSnapshot | None:
+    """
+    Return a cached source for the identifier if its entry has not expired.
+
+    Args:
+        identifier: Source name or ID used as cache key
 
+    Returns:
+        Source snapshot or None on cache miss
+    """
+    entry = _SOURCE_CACHE.get(identifier)
+    if entry is None:
         return None
 
-    except Exception as e:
-        logger.error(f"Failed to get last ingestion time for source {source_id}: {e}")
+    cached_at, source = entry
+    if time.monotonic() - cached_at > SOURCE_CACHE_TTL_SECONDS:
+        _SOURCE_CACHE.pop(identifier, None)
         return None
 
+    return source
 
-async def _start_run(session: AsyncSession, source_id: int) -> int:
+
+def _cache_source(identifier: str | int, source: SourceSnapshot) -> None:
     """
-    Start a new ingestion run and return its ID.
+    Store a source snapshot in the lookup cache.
+
+    Args:
+        identifier: Source name or ID used as cache key
+        source: Snapshot of the loaded source
+    """
+    _SOURCE_CACHE[identifier] = (time.monotonic(), source)
+
+
+def invalidate_source_cache() -> None:
+    """Drop all memoized source lookups so the next task re-reads the sources table."""
+    _SOURCE_CACHE.clear()
+
+
+async def get_source_with_last_run(
+    session: AsyncSession,
+    identifier: str | int,
+) -> tuple[SourceSnapshot | None, datetime | None]:
+    """
+    Get an active source together with the completion time of its last successful run.
+
+    Partial runs count as successful: the items they did write are safe to resume from.
+
+    On a cache miss both values are fetched in a single statement using a correlated
+    scalar subquery; on a hit only the last run is queried. Concurrent misses are not
+    coordinated: the source is then loaded more than once, which is harmless.
 
     Args:
         session: Database session
+        identifier: Source name or ID to look up
+
+    Returns:
+        Tuple of (source snapshot or None if not found, last completed_at or None)
+    """
+    try:
+        cached_source = _get_cached_source(identifier)
+        if cached_source is None:
+            stmt = (
+                _STMT_SOURCE_WITH_LAST_RUN_BY_ID if isinstance(identifier, int) else _STMT_SOURCE_WITH_LAST_RUN_BY_NAME
+            )
+            row = (await session.execute(stmt, {"identifier": identifier})).one_or_none()
+            if row is None:
+                return None, None
+
+            snapshot = SourceSnapshot.from_row(row)
+            _cache_source(identifier, snapshot)
+            return snapshot, row.last_completed
+
+        result = await session.execute(_STMT_LAST_COMPLETED, {"source_id": cached_source.id})
+        return cached_source, result.scalar_one_or_none()
+    except Exception as e:
+        logger.error(f"Failed to get source with last run for identifier '{identifier}': {e}")
+        return None, None
+
+
+async def _start_run(
+    ingestion_service: IngestionService,
+    source_id: int,
+    started_at: datetime | None = None,
+) -> int:
+    """
+    Start a new ingestion run and return its ID.
+
+    Args:
+        ingestion_service: Ingestion service bound to the task session
         source_id: ID of the source being ingested
+        started_at: When the run started (defaults to now)
 
     Returns:
         ID of the created ingestion run
@@ -357,14 +588,10 @@ async def _start_run(session: AsyncSession, source_id: int) -> int:
         Exception: If run creation fails
     """
     try:
-        ingestion_service = IngestionService(session)
-        run = await ingestion_service.create_ingestion_run(source_id)
+        run_id = await ingestion_service.create_running_run(source_id, started_at=started_at)
 
-        # Update status to running
-        await ingestion_service.update_ingestion_run(run.id, status="running")
-
-        logger.info(f"Started ingestion run {run.id} for source {source_id}")
-        return run.id
+        logger.debug(f"Started ingestion run {run_id} for source {source_id}")
+        return run_id
 
     except Exception as e:
         logger.error(f"Failed to start ingestion run for source {source_id}: {e}")
@@ -372,30 +599,30 @@ async def _start_run(session: AsyncSession, source_id: int) -> int:
 
 
 async def _finish_run(
-    session: AsyncSession,
+    ingestion_service: IngestionService,
     run_id: int,
     items_processed: int,
     items_new: int,
     items_updated: int,
     errors: int,
+    completed_at: datetime | None = None,
 ) -> None:
     """
     Mark an ingestion run as completed with final statistics.
 
     Args:
-        session: Database session
+        ingestion_service: Ingestion service to write through
         run_id: ID of the ingestion run
         items_processed: Total items processed
         items_new: Number of new items created
         items_updated: Number of items updated
         errors: Number of errors encountered
+        completed_at: When the run completed (defaults to now)
     """
     try:
-        ingestion_service = IngestionService(session)
+        status = resolve_run_status(errors, items_new + items_updated)
 
-        status = "completed" if errors == 0 else "failed"
-
-        await ingestion_service.update_ingestion_run(
+        await ingestion_service.finish_ingestion_run(
             run_id=run_id,
             status=status,
             items_processed=items_processed,
@@ -403,36 +630,98 @@ async def _finish_run(
             items_updated=items_updated,
             items_failed=errors,
             errors_count=errors,
-            completed_at=datetime.now(UTC),
+            completed_at=completed_at or datetime.now(UTC),
         )
 
-        logger.info(f"Finished ingestion run {run_id} with status {status}")
+        logger.debug(f"Finished ingestion run {run_id} with status {status}")
 
     except Exception as e:
         logger.error(f"Failed to finish ingestion run {run_id}: {e}")
         # Don't raise here to avoid masking the original error
 
 
-async def _fail_run(session: AsyncSession, run_id: int, error_message: str) -> None:
+async def _fail_run(
+    ingestion_service: IngestionService,
+    run_id: int,
+    error_message: str,
+    completed_at: datetime | None = None,
+) -> None:
     """
     Mark an ingestion run as failed with error details.
 
     Args:
-        session: Database session
+        ingestion_service: Ingestion service to write through
         run_id: ID of the ingestion run
         error_message: Error message to record
+        completed_at: When the run failed (defaults to now)
     """
     try:
-        ingestion_service = IngestionService(session)
-
-        await ingestion_service.update_ingestion_run(
+        await ingestion_service.finish_ingestion_run(
             run_id=run_id,
             status="failed",
             error_notes=error_message[:1000],  # Truncate to fit database field
-            completed_at=datetime.now(UTC),
+            completed_at=completed_at or datetime.now(UTC),
         )
 
-        logger.info(f"Marked ingestion run {run_id} as failed")
+        logger.debug(f"Marked ingestion run {run_id} as failed")
 
     except Exception as e:
         logger.error(f"Failed to mark ingestion run {run_id} as failed: {e}")
+
+
+def _finish_run_in_background(
+    session: AsyncSession,
+    run_id: int,
+    items_processed: int,
+    items_new: int,
+    items_updated: int,
+    errors: int,
+) -> None:
+    """
+    Schedule _finish_run on a separate session without waiting for it to commit.
+
+    Args:
+        session: Task session whose bind the bookkeeping session is opened on
+        run_id: ID of the ingestion run
+        items_processed: Total items processed
+        items_new: Number of new items created
+        items_updated: Number of items updated
+        errors: Number of errors encountered
+    """
+    _spawn_background_write(
+        _write_detached(
+            session.bind,
+            partial(
+                _finish_run,
+                run_id=run_id,
+                items_processed=items_processed,
+                items_new=items_new,
+                items_updated=items_updated,
+                errors=errors,
+                completed_at=datetime.now(UTC),
+            ),
+        ),
+    )
+
+
+async def _write_detached[T](
+    bind: AsyncEngine | AsyncConnection,
+    write: Callable[[IngestionService], Coroutine[Any, Any, T]],
+) -> T:
+    """
+    Run a bookkeeping write on its own short-lived session.
+
+    Args:
+        bind: Engine or connection to open the session on
+        write: Coroutine function taking an ingestion service as its only positional argument
+
+    Returns:
+        Whatever the write returns
+    """
+    # Bookkeeping writes are single statements, so autocommit sends each in one round
+    # trip instead of wrapping it in BEGIN ... COMMIT
+    if isinstance(bind, AsyncEngine):
+        bind = bind.execution_options(isolation_level="AUTOCOMMIT")
+
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        return await write(IngestionService(session))
@@ -6,13 +6,23 @@ including retry logic, caching support, and proper error handling.
 """
 
 import asyncio
+import inspect
 import os
+import random
+import threading
 import time
-from datetime import datetime, timedelta
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+import orjson
+import pyarrow as pa
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from dashboard.telemetry import track_api_call, track_rate_limit_event
 
@@ -25,15 +35,121 @@ class RateLimitError(Exception):
         self.wait_time = wait_time
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delay seconds or an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+# Parsed body of an API response
+ResponseData = dict[str, Any] | list[Any]
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of ETag-tagged API responses that expire after a TTL.
+
+    Entries are keyed by request (method, endpoint and query parameters), so any
+    session can revalidate a response another session fetched.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, str, ResponseData]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[str, ResponseData] | None:
+        """Get the (etag, data) cached for a request, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            cached_at, etag, data = entry
+            if time.monotonic() - cached_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return etag, data
+
+    def put(self, key: Hashable, etag: str, data: ResponseData) -> None:
+        """Cache a response, evicting the least recently used entries beyond maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), etag, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource
+def _shared_response_cache() -> ResponseCache:
+    """Get the response cache shared by all sessions of this Streamlit process."""
+    return ResponseCache()
+
+
+# Statuses worth retrying: the gateway or upstream is briefly unavailable
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+def _should_retry(exc: Exception) -> bool:
+    """Whether a failed request may succeed if retried: transient 5xx, timeouts and connection errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS_CODES
+    # Covers timeouts and connection errors; errors building the request itself won't recover
+    return isinstance(exc, httpx.TransportError)
+
+
+# Media type of Arrow IPC streams, which the analytics bundle can be requested as
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _parse_response(response: httpx.Response) -> ResponseData:
+    """
+    Parse a response body.
+
+    JSON is parsed as is. An analytics bundle sent as an Arrow IPC stream carries its
+    items as record batches, read straight into a DataFrame, and the rest of the bundle
+    as JSON in the schema metadata.
+    """
+    if not response.headers.get("content-type", "").startswith(ARROW_STREAM_MEDIA_TYPE):
+        return orjson.loads(response.content)
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    data = orjson.loads(table.schema.metadata[b"bundle"])
+    data["items"] = table.to_pandas()
+    return data
+
+
+def _cache_key(method: str, endpoint: str, params: dict[str, Any] | None) -> Hashable:
+    """Build the cache key of a request from its method, endpoint and query parameters."""
+    return method, endpoint, tuple(sorted((params or {}).items()))
+
+
 class DataSeedAPIClient:
     """
     HTTP client for DataSeed API with caching and retry support.
 
     Features:
     - Automatic retries with exponential backoff
-    - ETag-based caching support
+    - Pooled keep-alive connections shared by all requests
+    - ETag-based caching shared by all dashboard sessions
     - User-Agent header for dashboard identification
-    - Session state integration for caching
+    - Session state integration for rate limiting
     """
 
     def __init__(self, base_url: str = "http://localhost:8000"):
@@ -44,56 +160,97 @@ class DataSeedAPIClient:
         self.base_retry_delay = 1.0  # Base delay for exponential backoff
         self.max_retry_delay = 60.0  # Maximum retry delay
 
-        # Initialize cache and rate limiting state in session state
-        if "api_cache" not in st.session_state:
-            st.session_state.api_cache = {}
-        if "api_etags" not in st.session_state:
-            st.session_state.api_etags = {}
+        # One pooled client per event loop: httpx clients can't be shared across loops,
+        # and run_async drives requests from each browser session's own loop
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        # GET requests in flight, keyed by event loop and request, for coalescing duplicates
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    def _get_rate_limit_state(self) -> dict[str, Any]:
+        """
+        Get the rate limiting state of the current session, initializing it on first use.
+
+        The client is a shared resource used by every browser session, so the
+        per-session state is set up on use rather than once in __init__.
+        """
         if "rate_limit_state" not in st.session_state:
             st.session_state.rate_limit_state = {
                 "backoff_until": None,
                 "current_delay": self.base_retry_delay,
                 "consecutive_429s": 0,
             }
-
-    def _get_headers(self, endpoint: str) -> dict[str, str]:
+        return st.session_state.rate_limit_state
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent, "Accept": "application/json"},
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0),
+                # Multiplexes concurrent fan-out requests over one connection where the API
+                # is served over TLS with HTTP/2; plain http:// stays on HTTP/1.1
+                http2=True,
+            )
+            self._clients[loop] = client
+        return client
+
+    def close_loop_client(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Close the pooled HTTP client bound to an event loop, before that loop is closed.
+
+        A loop another thread is running is left alone. The close is driven on a helper
+        thread, since the calling thread may be running an event loop of its own.
+        """
+        if loop.is_closed() or loop.is_running():
+            return
+
+        client = self._clients.pop(loop, None)
+        if client is None or client.is_closed:
+            return
+
+        closer = threading.Thread(target=loop.run_until_complete, args=(client.aclose(),), name="api-client-close")
+        closer.start()
+        closer.join()
+
+    def _get_headers(self, cached: tuple[str, ResponseData] | None, accept: str = "application/json") -> dict[str, str]:
         """Get headers for request including User-Agent and conditional ETag."""
         headers = {
             "User-Agent": self.user_agent,
-            "Accept": "application/json",
+            "Accept": accept,
         }
 
-        # Add If-None-Match header if we have an ETag for this endpoint
-        if endpoint in st.session_state.api_etags:
-            headers["If-None-Match"] = st.session_state.api_etags[endpoint]
+        # Add If-None-Match header if we have a cached response for this request
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
         return headers
 
-    def _cache_response(self, endpoint: str, response: httpx.Response, data: Any) -> None:
-        """Cache response data and ETag if present."""
+    def _cache_response(self, cache_key: Hashable, response: httpx.Response, data: ResponseData) -> None:
+        """Cache response data if the response carries an ETag."""
         if "etag" in response.headers:
-            st.session_state.api_etags[endpoint] = response.headers["etag"]
-            st.session_state.api_cache[endpoint] = {
-                "data": data,
-                "cached_at": datetime.now(),
-                "etag": response.headers["etag"],
-            }
-
-    def _get_cached_data(self, endpoint: str) -> Any | None:
-        """Get cached data if available and not expired."""
-        if endpoint not in st.session_state.api_cache:
-            return None
+            _shared_response_cache().put(cache_key, response.headers["etag"], data)
 
-        cache_entry = st.session_state.api_cache[endpoint]
-        # Cache expires after 5 minutes
-        if datetime.now() - cache_entry["cached_at"] > timedelta(minutes=5):
+    def _revalidated_data(
+        self,
+        cache_key: Hashable,
+        cached: tuple[str, ResponseData] | None,
+    ) -> ResponseData | None:
+        """Return the cached data confirmed by a 304, restarting its TTL."""
+        if cached is None:
             return None
 
-        return cache_entry["data"]
+        etag, data = cached
+        _shared_response_cache().put(cache_key, etag, data)
+        return data
 
-    def _check_rate_limit(self) -> float | None:
+    def _check_rate_limit(self, rate_limit_state: dict[str, Any]) -> float | None:
         """Check if we're currently rate limited and return wait time if so."""
-        rate_limit_state = st.session_state.rate_limit_state
 
         if rate_limit_state["backoff_until"]:
             wait_time = rate_limit_state["backoff_until"] - time.time()
@@ -106,127 +263,175 @@ class DataSeedAPIClient:
 
         return None
 
-    def _handle_rate_limit_response(self) -> float:
+    def _handle_rate_limit_response(self, response: httpx.Response, rate_limit_state: dict[str, Any]) -> float:
         """Handle 429 response and return backoff delay."""
-        rate_limit_state = st.session_state.rate_limit_state
         rate_limit_state["consecutive_429s"] += 1
 
+        # The server knows when its window resets, so prefer its Retry-After
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            current_delay = min(retry_after, self.max_retry_delay)
+            rate_limit_state["current_delay"] = current_delay
+            rate_limit_state["backoff_until"] = time.time() + current_delay
+            return current_delay
+
         # Exponential backoff: double the delay each time, up to max
         current_delay = min(
             rate_limit_state["current_delay"] * (2 ** (rate_limit_state["consecutive_429s"] - 1)),
             self.max_retry_delay,
         )
+        # Full jitter, so dashboards rate limited together don't all retry at the same moment
+        backoff_delay = random.uniform(0, current_delay)  # noqa: S311
 
         rate_limit_state["current_delay"] = current_delay
-        rate_limit_state["backoff_until"] = time.time() + current_delay
+        rate_limit_state["backoff_until"] = time.time() + backoff_delay
+
+        return backoff_delay
 
-        return current_delay
+    def _retry_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay before retrying a failed attempt."""
+        return random.uniform(0, min(self.max_retry_delay, self.base_retry_delay * (2**attempt)))  # noqa: S311
 
-    def _reset_rate_limit_state(self) -> None:
+    def _reset_rate_limit_state(self, rate_limit_state: dict[str, Any]) -> None:
         """Reset rate limiting state after successful request."""
-        rate_limit_state = st.session_state.rate_limit_state
         rate_limit_state["consecutive_429s"] = 0
         rate_limit_state["current_delay"] = self.base_retry_delay
         rate_limit_state["backoff_until"] = None
 
-    async def _make_request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        accept: str = "application/json",
+    ) -> dict[str, Any]:
+        """
+        Make HTTP request, sharing an identical GET request already in flight on this loop.
+
+        Charts rendered together often ask for the same data; concurrent callers
+        await the one request instead of each sending their own.
+        """
+        if method != "GET":
+            return await self._send_request(method, endpoint, params, accept)
+
+        key = (asyncio.get_running_loop(), _cache_key(method, endpoint, params))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, endpoint, params, accept))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one caller being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        accept: str = "application/json",
+    ) -> dict[str, Any]:
         """Make HTTP request with retry logic, caching, and rate limiting."""
+        # Read the session's rate limit state once; every step below updates it in place
+        rate_limit_state = self._get_rate_limit_state()
+
         # Check if we're currently rate limited
-        wait_time = self._check_rate_limit()
+        wait_time = self._check_rate_limit(rate_limit_state)
         if wait_time:
             raise RateLimitError(f"Rate limited. Please wait {wait_time:.1f} seconds before retrying.", wait_time)
 
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers(endpoint)
+        # Look the cached response up once, so a 304 always has the data its ETag named
+        cache_key = _cache_key(method, endpoint, params)
+        cached = _shared_response_cache().get(cache_key)
+        headers = self._get_headers(cached, accept)
+        client = await self._get_client()
 
         # Track API call performance
         start_time = time.time()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for attempt in range(self.max_retries):
-                try:
-                    response = await client.request(method=method, url=url, headers=headers, **kwargs)
+        for attempt in range(self.max_retries):
+            try:
+                response = await client.request(method=method, url=endpoint, headers=headers, params=params)
+
+                # Calculate duration for telemetry
+                duration_ms = (time.time() - start_time) * 1000
+
+                # Handle 304 Not Modified - return cached data
+                if response.status_code == 304:
+                    cached_data = self._revalidated_data(cache_key, cached)
+                    if cached_data is not None:
+                        # Reset rate limit state on successful cache hit
+                        self._reset_rate_limit_state(rate_limit_state)
+                        # Track successful cached API call
+                        track_api_call(endpoint, method, duration_ms, 304, cache_hit=True)
+                        return cached_data
+
+                # Handle 429 Too Many Requests
+                if response.status_code == 429:
+                    backoff_delay = self._handle_rate_limit_response(response, rate_limit_state)
+                    # Track rate limit event
+                    track_rate_limit_event(backoff_delay, rate_limit_state["consecutive_429s"], endpoint)
+                    raise RateLimitError(
+                        f"Rate limited. Backing off for {backoff_delay:.1f} seconds.",
+                        backoff_delay,
+                    )
+
+                # Raise for other HTTP errors
+                response.raise_for_status()
+
+                # Parse JSON response, or the Arrow stream of a bundle
+                data = _parse_response(response)
+
+                # Cache successful responses and reset rate limit state
+                self._cache_response(cache_key, response, data)
+                self._reset_rate_limit_state(rate_limit_state)
+
+                # Track successful API call
+                track_api_call(endpoint, method, duration_ms, response.status_code, cache_hit=False)
+
+                return data
+
+            except httpx.HTTPStatusError as e:
+                if e.response and e.response.status_code == 304:
+                    # Handle 304 case
+                    cached_data = self._revalidated_data(cache_key, cached)
+                    if cached_data is not None:
+                        self._reset_rate_limit_state(rate_limit_state)
+                        duration_ms = (time.time() - start_time) * 1000
+                        track_api_call(endpoint, method, duration_ms, 304, cache_hit=True)
+                        return cached_data
 
-                    # Calculate duration for telemetry
+                if e.response and e.response.status_code == 429:
+                    # Track rate limit event
                     duration_ms = (time.time() - start_time) * 1000
+                    track_rate_limit_event(
+                        rate_limit_state.get("current_delay", 1.0),
+                        rate_limit_state.get("consecutive_429s", 1),
+                        endpoint,
+                    )
+                    track_api_call(endpoint, method, duration_ms, 429, cache_hit=False)
+                    # Don't retry 429s immediately, let the backoff handle it
+                    raise
 
-                    # Handle 304 Not Modified - return cached data
-                    if response.status_code == 304:
-                        cached_data = self._get_cached_data(endpoint)
-                        if cached_data:
-                            # Reset rate limit state on successful cache hit
-                            self._reset_rate_limit_state()
-                            # Track successful cached API call
-                            track_api_call(endpoint, method, duration_ms, 304, cache_hit=True)
-                            return cached_data
-
-                    # Handle 429 Too Many Requests
-                    if response.status_code == 429:
-                        backoff_delay = self._handle_rate_limit_response()
-                        # Track rate limit event
-                        rate_limit_state = st.session_state.rate_limit_state
-                        track_rate_limit_event(backoff_delay, rate_limit_state["consecutive_429s"], endpoint)
-                        raise RateLimitError(
-                            f"Rate limited. Backing off for {backoff_delay:.1f} seconds.",
-                            backoff_delay,
-                        )
-
-                    # Raise for other HTTP errors
-                    response.raise_for_status()
-
-                    # Parse JSON response
-                    data = response.json()
-
-                    # Cache successful responses and reset rate limit state
-                    self._cache_response(endpoint, response, data)
-                    self._reset_rate_limit_state()
-
-                    # Track successful API call
-                    track_api_call(endpoint, method, duration_ms, response.status_code, cache_hit=False)
-
-                    return data
-
-                except httpx.HTTPStatusError as e:
-                    if e.response and e.response.status_code == 304:
-                        # Handle 304 case
-                        cached_data = self._get_cached_data(endpoint)
-                        if cached_data:
-                            self._reset_rate_limit_state()
-                            duration_ms = (time.time() - start_time) * 1000
-                            track_api_call(endpoint, method, duration_ms, 304, cache_hit=True)
-                            return cached_data
-
-                    if e.response and e.response.status_code == 429:
-                        # Track rate limit event
-                        rate_limit_state = st.session_state.rate_limit_state
-                        duration_ms = (time.time() - start_time) * 1000
-                        track_rate_limit_event(
-                            rate_limit_state.get("current_delay", 1.0),
-                            rate_limit_state.get("consecutive_429s", 1),
-                            endpoint,
-                        )
-                        track_api_call(endpoint, method, duration_ms, 429, cache_hit=False)
-                        # Don't retry 429s immediately, let the backoff handle it
-                        raise
+                # Client errors won't change on retry; only transient gateway errors are retried
+                if not _should_retry(e) or attempt == self.max_retries - 1:
+                    raise
 
-                    if attempt == self.max_retries - 1:
-                        raise
+                # Wait before retry (exponential backoff)
+                await asyncio.sleep(self._retry_delay(attempt))
 
-                    # Wait before retry (exponential backoff)
-                    await asyncio.sleep(2**attempt)
+            except (httpx.RequestError, httpx.TimeoutException) as e:
+                if not _should_retry(e) or attempt == self.max_retries - 1:
+                    raise
 
-                except (httpx.RequestError, httpx.TimeoutException):
-                    if attempt == self.max_retries - 1:
-                        raise
-
-                    # Wait before retry
-                    await asyncio.sleep(2**attempt)
+                # Wait before retry
+                await asyncio.sleep(self._retry_delay(attempt))
 
         raise Exception(f"Failed to make request after {self.max_retries} attempts")
 
     def get_rate_limit_status(self) -> dict[str, Any]:
         """Get current rate limiting status for UI display."""
-        rate_limit_state = st.session_state.rate_limit_state
+        rate_limit_state = self._get_rate_limit_state()
 
         if rate_limit_state["backoff_until"]:
             wait_time = max(0, rate_limit_state["backoff_until"] - time.time())
@@ -276,7 +481,7 @@ class DataSeedAPIClient:
         params = {"sort": sort, "order": order, "limit": limit}
 
         if source:
-            params["source"] = source
+            params["source_name"] = source
         if q:
             params["q"] = q
         if cursor:
@@ -291,82 +496,45 @@ class DataSeedAPIClient:
             params["source_name"] = source_name
         return await self._make_request("GET", "/api/v1/items/stats", params=params)
 
-    async def get_items_for_analytics(
+    async def get_analytics_bundle(
         self,
         window: str = "24h",
         sources: list[str] | None = None,
         search_query: str | None = None,
-        limit: int = 1000,
-    ) -> list[dict[str, Any]]:
-        """Get items data for analytics charts and export."""
-        all_items = []
-        cursor = None
-
-        # Use cursor-based pagination for better performance
-        while len(all_items) < limit:
-            batch_limit = min(100, limit - len(all_items))
-
-            # Get items for each source if specified, otherwise get all
-            if sources and len(sources) == 1:
-                # Single source - use source filter
-                response = await self.get_items(source=sources[0], q=search_query, limit=batch_limit, cursor=cursor)
-                items = response.get("items", [])
-                all_items.extend(items)
-                cursor = response.get("next_cursor")
-                if not cursor or len(items) < batch_limit:
-                    break
-            else:
-                # Multiple sources or all sources
-                response = await self.get_items(q=search_query, limit=batch_limit, cursor=cursor)
-                items = response.get("items", [])
-                all_items.extend(items)
-                cursor = response.get("next_cursor")
-                if not cursor or len(items) < batch_limit:
-                    break
-
-        # Filter by sources if multiple specified
-        if sources and len(sources) > 1:
-            all_items = [item for item in all_items if item.get("source_id") in sources]
-
-        return all_items[:limit]
-
-    async def get_time_series_data(
-        self,
-        window: str = "24h",
-        sources: list[str] | None = None,
+        trending_limit: int = 20,
+        items_limit: int = 1000,
         granularity: str = "hour",
-    ) -> list[dict[str, Any]]:
-        """Get time series data for charts."""
-        # This would ideally be a dedicated endpoint, but for now we'll process items
-        items = await self.get_items_for_analytics(window=window, sources=sources)
-
-        # Group items by time period
-        from collections import defaultdict
-        from datetime import datetime
-
-        time_buckets = defaultdict(int)
-
-        # Determine bucket size based on granularity
-        if granularity == "hour":
-            bucket_minutes = 60
-        elif granularity == "day":
-            bucket_minutes = 1440  # 24 * 60
-        else:
-            bucket_minutes = 60  # default to hour
-
-        for item in items:
-            # Parse the published_at timestamp
-            published_at = datetime.fromisoformat(item["published_at"].replace("Z", "+00:00"))
-
-            # Round down to the nearest bucket
-            minutes_since_epoch = int(published_at.timestamp() / 60)
-            bucket_start = (minutes_since_epoch // bucket_minutes) * bucket_minutes
-            bucket_time = datetime.fromtimestamp(bucket_start * 60)
-
-            time_buckets[bucket_time] += 1
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get the stats, items, time series and trending items of an analytics view in one request.
+
+        With fields, the items only carry those fields, so columns the caller would discard
+        aren't transferred and parsed. They are then requested as an Arrow IPC stream and
+        returned as a DataFrame instead of a list of dicts.
+        """
+        params = {
+            "window": window,
+            "items_limit": items_limit,
+            "trending_limit": trending_limit,
+            "granularity": granularity,
+        }
 
-        # Convert to list format for charts
-        return [{"timestamp": timestamp, "count": count} for timestamp, count in sorted(time_buckets.items())]
+        if sources:
+            # A tuple keeps the parameters hashable for the response cache
+            params["sources"] = tuple(sources)
+        if search_query:
+            params["q"] = search_query
+        if fields:
+            params["fields"] = tuple(fields)
+            return await self._make_request(
+                "GET",
+                "/api/v1/items/analytics",
+                params=params,
+                accept=ARROW_STREAM_MEDIA_TYPE,
+            )
+
+        return await self._make_request("GET", "/api/v1/items/analytics", params=params)
 
     async def get_trending_items(
         self,
@@ -387,20 +555,108 @@ class DataSeedAPIClient:
         return response if isinstance(response, list) else []
 
 
-# Global API client instance
-# @st.cache_resource
+# Global API client instance, shared across reruns and sessions so its connection pool persists
+@st.cache_resource
 def get_api_client() -> DataSeedAPIClient:
     """Get cached API client instance."""
     base_url = os.getenv("API_BASE_URL", "http://localhost:8000")
     return DataSeedAPIClient(base_url=base_url)
 
 
-def run_async(coro):
-    """Helper function to run async code in Streamlit."""
+# Cached fetches for analytics views. Reruns triggered by widget changes call these with
+# unchanged arguments, so results are memoized briefly instead of re-requested.
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def cached_sources(status: str | None = None, search: str | None = None) -> dict[str, Any]:
+    """Get data sources, cached for a minute."""
+    return run_async(get_api_client().get_sources(status=status, search=search))
+
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def cached_stats(window: str = "24h", source_name: str | None = None) -> dict[str, Any]:
+    """Get analytics and statistics, cached for a minute."""
+    return run_async(get_api_client().get_stats(window=window, source_name=source_name))
+
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def cached_trending(
+    window: str = "24h",
+    source: str | None = None,
+    limit: int = 10,
+    use_hot_score: bool = False,
+) -> list[dict[str, Any]]:
+    """Get trending content items, cached for a minute."""
+    return run_async(
+        get_api_client().get_trending_items(window=window, source=source, limit=limit, use_hot_score=use_hot_score),
+    )
+
+
+# Fallback event loop per thread, for threads without a session loop. A single module-wide
+# loop can't be shared: concurrent sessions run on different threads, and a loop only runs
+# in one thread at a time. The coroutines also need the thread's session state.
+_thread_loops = threading.local()
+
+
+def _close_loop_client(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the API client's pooled connections on an event loop about to be closed."""
+    get_api_client().close_loop_client(loop)
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Close an event loop, closing the API client's pooled connections on it first."""
+    _close_loop_client(loop)
+    loop.close()
+
+
+def _track_session_loop() -> asyncio.AbstractEventLoop:
+    """Get the current session's event loop, released with the session."""
+    return asyncio.get_event_loop()
+
+
+# Streamlit closes a session's loop when the session ends, after releasing the session's
+# resources. Where it has session-scoped resources, the loop's connections are closed then.
+if "scope" in inspect.signature(st.cache_resource).parameters:
+    _track_session_loop = st.cache_resource(scope="session", on_release=_close_loop_client, show_spinner=False)(
+        _track_session_loop,
+    )
+
+
+def _session_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Get the event loop Streamlit keeps for the current browser session, if any.
+
+    A session's script threads come and go between reruns, but the loop Streamlit
+    installs in them lives as long as the session. Requests driven on it reuse the
+    pooled client bound to it, and so its keep-alive connections, across reruns.
+    """
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
     try:
         loop = asyncio.get_event_loop()
     except RuntimeError:
+        # Streamlit versions that don't install a loop in script threads
+        return None
+    if loop.is_closed() or loop.is_running():
+        return None
+    _track_session_loop()
+    return loop
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the session's event loop, or the current thread's own, created on first use or after it was closed."""
+    loop = _session_loop()
+    if loop is not None:
+        return loop
+
+    loop = getattr(_thread_loops, "loop", None)
+    if loop is None or loop.is_closed():
         loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        _thread_loops.loop = loop
+        # Close the loop, and the connections on it, when its thread goes away instead of
+        # leaking them. Not at interpreter exit, which no longer allows the closing thread.
+        weakref.finalize(threading.current_thread(), _close_loop, loop).atexit = False
+    return loop
 
-    return loop.run_until_complete(coro)
+
+def run_async(coro):
+    """Helper function to run async code in Streamlit."""
+    return _get_loop().run_until_complete(coro)
@@ -7,30 +7,54 @@ including line charts, bar charts, pie charts, and histograms.
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+ChartData = list[dict[str, Any]] | pd.DataFrame
 
-def render_items_over_time_chart(data: list[dict[str, Any]], title: str = "Items Over Time", height: int = 400) -> None:
+
+def _as_df(data: ChartData) -> pd.DataFrame:
+    """Use a DataFrame as is, or build one from a list of records."""
+    return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+
+def _hash_frame(df: pd.DataFrame) -> bytes:
+    """Hash a DataFrame by content for figure caching."""
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+
+# Figures are rebuilt only when their data or options change; builders receive just the
+# columns they plot so the frames they hash stay small and hashable
+_cache_figure = st.cache_data(ttl=120, max_entries=64, show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+
+
+def render_items_over_time_chart(data: ChartData, title: str = "Items Over Time", height: int = 400) -> None:
     """
     Render a line chart showing items ingested over time.
 
     Args:
-        data: List of dictionaries with 'timestamp' and 'count' keys
+        data: Records or DataFrame with 'timestamp' and 'count' keys
         title: Chart title
         height: Chart height in pixels
     """
-    if not data:
+    df = _as_df(data)
+    if df.empty:
         st.info("No data available for time series chart")
         return
 
-    df = pd.DataFrame(data)
+    fig = _build_items_over_time_fig(df[["timestamp", "count"]], title, height)
+    st.plotly_chart(fig, use_container_width=True)
+
 
-    # Ensure timestamp is datetime
-    if "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
+@_cache_figure
+def _build_items_over_time_fig(df: pd.DataFrame, title: str, height: int) -> go.Figure:
+    """Build the items-over-time line figure."""
+    # Ensure timestamp is datetime, without mutating a caller's DataFrame
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df = df.assign(timestamp=pd.to_datetime(df["timestamp"], utc=True, format="ISO8601", errors="coerce"))
 
     fig = px.line(
         df,
@@ -51,11 +75,11 @@ def render_items_over_time_chart(data: list[dict[str, Any]], title: str = "Items
 
     fig.update_traces(line=dict(width=3, color="#1f77b4"), hovertemplate="<b>%{y}</b> items<br>%{x}<extra></extra>")
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_top_sources_chart(
-    data: list[dict[str, Any]],
+    data: ChartData,
     title: str = "Top Sources by Volume",
     height: int = 400,
 ) -> None:
@@ -63,16 +87,22 @@ def render_top_sources_chart(
     Render a bar chart showing top sources by item count.
 
     Args:
-        data: List of dictionaries with 'source_name' and 'item_count' keys
+        data: Records or DataFrame with 'source_name' and 'item_count' keys
         title: Chart title
         height: Chart height in pixels
     """
-    if not data:
+    df = _as_df(data)
+    if df.empty:
         st.info("No data available for sources chart")
         return
 
-    df = pd.DataFrame(data)
+    fig = _build_top_sources_fig(df[["source_name", "item_count"]], title, height)
+    st.plotly_chart(fig, use_container_width=True)
+
 
+@_cache_figure
+def _build_top_sources_fig(df: pd.DataFrame, title: str, height: int) -> go.Figure:
+    """Build the top-sources bar figure."""
     fig = px.bar(
         df,
         x="source_name",
@@ -93,11 +123,11 @@ def render_top_sources_chart(
 
     fig.update_traces(hovertemplate="<b>%{x}</b><br>%{y} items<extra></extra>")
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_score_distribution_chart(
-    data: list[dict[str, Any]],
+    data: ChartData | np.ndarray,
     title: str = "Score Distribution",
     height: int = 400,
     bins: int = 20,
@@ -106,42 +136,65 @@ def render_score_distribution_chart(
     Render a histogram showing the distribution of item scores.
 
     Args:
-        data: List of dictionaries with 'score' key
+        data: Records or DataFrame with 'score' key, or an array of the scores
         title: Chart title
         height: Chart height in pixels
         bins: Number of histogram bins
     """
-    if not data:
-        st.info("No data available for score distribution chart")
-        return
-
-    df = pd.DataFrame(data)
+    if isinstance(data, np.ndarray):
+        scores = data.astype("float64", copy=False)
+    else:
+        df = _as_df(data)
+        if df.empty:
+            st.info("No data available for score distribution chart")
+            return
+        scores = df["score"].to_numpy(dtype="float64", na_value=np.nan)
 
-    # Filter out null scores
-    df = df[df["score"].notna()]
+    # Filter out null scores on the raw array rather than copying the frame
+    scores = scores[~np.isnan(scores)]
 
-    if df.empty:
+    if scores.size == 0:
         st.info("No score data available")
         return
 
-    fig = px.histogram(
-        df,
-        x="score",
-        nbins=bins,
-        title=title,
-        labels={"score": "Score", "count": "Number of Items"},
-        color_discrete_sequence=["#2E86AB"],
+    # Bin here so the figure carries one bar per bin instead of every raw score; single
+    # precision is plenty for binning
+    counts, edges = np.histogram(scores.astype(np.float32), bins=bins)
+
+    fig = _build_score_distribution_fig(counts, edges, title, height)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@_cache_figure
+def _build_score_distribution_fig(counts: np.ndarray, edges: np.ndarray, title: str, height: int) -> go.Figure:
+    """Build the score histogram figure from bin counts and edges."""
+    fig = go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges) * 0.9,
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            marker_color="#2E86AB",
+        ),
     )
 
-    fig.update_layout(height=height, showlegend=False, xaxis_title="Score", yaxis_title="Number of Items", bargap=0.1)
+    fig.update_layout(
+        title=title,
+        height=height,
+        showlegend=False,
+        xaxis_title="Score",
+        yaxis_title="Number of Items",
+    )
 
-    fig.update_traces(hovertemplate="Score: %{x}<br>Count: %{y}<extra></extra>")
+    fig.update_traces(
+        hovertemplate="Score: %{customdata[0]:,.2~f}–%{customdata[1]:,.2~f}<br>Count: %{y}<extra></extra>",
+    )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_pie_chart(
-    data: list[dict[str, Any]],
+    data: ChartData,
     values_col: str,
     names_col: str,
     title: str = "Distribution",
@@ -151,18 +204,24 @@ def render_pie_chart(
     Render a pie chart for categorical data distribution.
 
     Args:
-        data: List of dictionaries containing the data
+        data: Records or DataFrame containing the data
         values_col: Column name for values
         names_col: Column name for labels
         title: Chart title
         height: Chart height in pixels
     """
-    if not data:
+    df = _as_df(data)
+    if df.empty:
         st.info("No data available for pie chart")
         return
 
-    df = pd.DataFrame(data)
+    fig = _build_pie_fig(df[[values_col, names_col]], values_col, names_col, title, height)
+    st.plotly_chart(fig, use_container_width=True)
+
 
+@_cache_figure
+def _build_pie_fig(df: pd.DataFrame, values_col: str, names_col: str, title: str, height: int) -> go.Figure:
+    """Build the pie figure."""
     fig = px.pie(
         df,
         values=values_col,
@@ -179,11 +238,11 @@ def render_pie_chart(
         hovertemplate="<b>%{label}</b><br>%{value} items<br>%{percent}<extra></extra>",
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_multi_line_chart(
-    data: list[dict[str, Any]],
+    data: ChartData,
     x_col: str,
     y_cols: list[str],
     title: str = "Multi-Series Chart",
@@ -193,18 +252,31 @@ def render_multi_line_chart(
     Render a multi-line chart for comparing multiple series.
 
     Args:
-        data: List of dictionaries containing the data
+        data: Records or DataFrame containing the data
         x_col: Column name for x-axis
         y_cols: List of column names for y-axis series
         title: Chart title
         height: Chart height in pixels
     """
-    if not data:
+    df = _as_df(data)
+    if df.empty:
         st.info("No data available for multi-line chart")
         return
 
-    df = pd.DataFrame(data)
+    columns = [x_col, *(col for col in y_cols if col in df.columns)]
+    fig = _build_multi_line_fig(df[columns], x_col, y_cols, title, height)
+    st.plotly_chart(fig, use_container_width=True)
+
 
+@_cache_figure
+def _build_multi_line_fig(
+    df: pd.DataFrame,
+    x_col: str,
+    y_cols: list[str],
+    title: str,
+    height: int,
+) -> go.Figure:
+    """Build the multi-line figure."""
     fig = go.Figure()
 
     colors = px.colors.qualitative.Set1
@@ -231,11 +303,11 @@ def render_multi_line_chart(
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_heatmap(
-    data: list[dict[str, Any]],
+    data: ChartData,
     x_col: str,
     y_col: str,
     z_col: str,
@@ -246,21 +318,35 @@ def render_heatmap(
     Render a heatmap for showing activity patterns.
 
     Args:
-        data: List of dictionaries containing the data
+        data: Records or DataFrame containing the data
         x_col: Column name for x-axis
         y_col: Column name for y-axis
         z_col: Column name for values (color intensity)
         title: Chart title
         height: Chart height in pixels
     """
-    if not data:
+    df = _as_df(data)
+    if df.empty:
         st.info("No data available for heatmap")
         return
 
-    df = pd.DataFrame(data)
+    fig = _build_heatmap_fig(df[[x_col, y_col, z_col]], x_col, y_col, z_col, title, height)
+    st.plotly_chart(fig, use_container_width=True)
 
-    # Pivot the data for heatmap
-    pivot_df = df.pivot(index=y_col, columns=x_col, values=z_col)
+
+@_cache_figure
+def _build_heatmap_fig(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    z_col: str,
+    title: str,
+    height: int,
+) -> go.Figure:
+    """Build the heatmap figure."""
+    # Pivot the data for heatmap, summing duplicate cells instead of raising on them
+    df = df.astype({x_col: "category", y_col: "category"})
+    pivot_df = df.pivot_table(index=y_col, columns=x_col, values=z_col, aggfunc="sum", fill_value=0, observed=True)
 
     fig = px.imshow(pivot_df, title=title, color_continuous_scale="viridis", aspect="auto")
 
@@ -270,7 +356,7 @@ def render_heatmap(
         yaxis_title=y_col.replace("_", " ").title(),
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_gauge_chart(
@@ -313,7 +399,7 @@ def render_gauge_chart(
 
 
 def render_box_plot(
-    data: list[dict[str, Any]],
+    data: ChartData,
     y_col: str,
     x_col: str | None = None,
     title: str = "Distribution Analysis",
@@ -323,22 +409,27 @@ def render_box_plot(
     Render a box plot for showing data distribution.
 
     Args:
-        data: List of dictionaries containing the data
+        data: Records or DataFrame containing the data
         y_col: Column name for y-axis values
         x_col: Optional column name for grouping
         title: Chart title
         height: Chart height in pixels
     """
-    if not data:
+    df = _as_df(data)
+    if df.empty:
         st.info("No data available for box plot")
         return
 
-    df = pd.DataFrame(data)
+    group_col = x_col if x_col and x_col in df.columns else None
+    columns = [y_col] if group_col is None else [group_col, y_col]
+    fig = _build_box_fig(df[columns], y_col, group_col, title, height)
+    st.plotly_chart(fig, use_container_width=True)
 
-    if x_col and x_col in df.columns:
-        fig = px.box(df, x=x_col, y=y_col, title=title)
-    else:
-        fig = px.box(df, y=y_col, title=title)
+
+@_cache_figure
+def _build_box_fig(df: pd.DataFrame, y_col: str, x_col: str | None, title: str, height: int) -> go.Figure:
+    """Build the box plot figure."""
+    fig = px.box(df, x=x_col, y=y_col, title=title)
 
     fig.update_layout(height=height)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
@@ -6,10 +6,24 @@ including time range selectors, source filters, and search inputs.
 """
 
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 import streamlit as st
 
+# Time window choices and their labels, with each key's position for the default lookup
+_TIME_WINDOW_OPTIONS = MappingProxyType(
+    {
+        "1h": "Last Hour",
+        "24h": "Last 24 Hours",
+        "7d": "Last 7 Days",
+        "30d": "Last 30 Days",
+        "90d": "Last 90 Days",
+    },
+)
+_TIME_WINDOW_KEYS = tuple(_TIME_WINDOW_OPTIONS)
+_TIME_WINDOW_INDEX = {window: index for index, window in enumerate(_TIME_WINDOW_KEYS)}
+
 
 def render_time_window_selector(key: str = "time_window", default: str = "24h") -> str:
     """
@@ -22,19 +36,11 @@ def render_time_window_selector(key: str = "time_window", default: str = "24h")
     Returns:
         Selected time window string
     """
-    options = {
-        "1h": "Last Hour",
-        "24h": "Last 24 Hours",
-        "7d": "Last 7 Days",
-        "30d": "Last 30 Days",
-        "90d": "Last 90 Days",
-    }
-
     selected = st.selectbox(
         "Time Window",
-        options=list(options.keys()),
-        format_func=lambda x: options[x],
-        index=list(options.keys()).index(default) if default in options else 1,
+        options=_TIME_WINDOW_KEYS,
+        format_func=_TIME_WINDOW_OPTIONS.__getitem__,
+        index=_TIME_WINDOW_INDEX.get(default, 1),
         key=key,
         help="Select the time period for analytics data",
     )
@@ -42,6 +48,18 @@ def render_time_window_selector(key: str = "time_window", default: str = "24h")
     return selected
 
 
+# Source catalogs larger than this get a search box, and at most SOURCE_SEARCH_LIMIT matches are listed
+SOURCE_SEARCH_THRESHOLD = 100
+SOURCE_SEARCH_LIMIT = 50
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _match_sources(available_sources: tuple[str, ...], query: str) -> list[str]:
+    """Return the first sources whose name contains the query, case-insensitively."""
+    needle = query.lower()
+    return [source for source in available_sources if needle in source.lower()][:SOURCE_SEARCH_LIMIT]
+
+
 def render_source_multiselect(
     available_sources: list[str],
     key: str = "source_filter",
@@ -61,9 +79,22 @@ def render_source_multiselect(
     if default is None:
         default = []
 
+    # Large catalogs make the dropdown lag on every keystroke, so narrow them with a search
+    # box first; sources already selected stay among the options so they remain selected
+    options = available_sources
+    if len(available_sources) > SOURCE_SEARCH_THRESHOLD:
+        query = st.text_input(
+            "Find Sources",
+            placeholder=f"Search {len(available_sources)} sources...",
+            key=f"{key}_search",
+        )
+        current = st.session_state.get(key, default)
+        matches = _match_sources(tuple(available_sources), query.strip())
+        options = [*current, *(source for source in matches if source not in current)]
+
     selected = st.multiselect(
         "Data Sources",
-        options=available_sources,
+        options=options,
         default=default,
         key=key,
         help="Select one or more data sources to include in analytics",
@@ -146,32 +177,36 @@ def render_analytics_filters(available_sources: list[str], key_prefix: str = "an
     """
     st.subheader("🔍 Filters")
 
+    # Filter widgets are keyed under their own prefix so Reset can find them all; other widgets
+    # sharing key_prefix, such as the page's auto-refresh controls, are left alone
+    filter_prefix = f"{key_prefix}_filter_"
+
     # Time window selector
-    time_window = render_time_window_selector(key=f"{key_prefix}_time_window")
+    time_window = render_time_window_selector(key=f"{filter_prefix}time_window")
 
     # Source filter
-    selected_sources = render_source_multiselect(available_sources=available_sources, key=f"{key_prefix}_sources")
+    selected_sources = render_source_multiselect(available_sources=available_sources, key=f"{filter_prefix}sources")
 
     # Search query
-    search_query = render_search_input(key=f"{key_prefix}_search")
+    search_query = render_search_input(key=f"{filter_prefix}search")
 
     # Advanced filters in expander
     with st.expander("Advanced Filters", expanded=False):
         # Custom date range option
         use_custom_dates = st.checkbox(
             "Use Custom Date Range",
-            key=f"{key_prefix}_use_custom_dates",
+            key=f"{filter_prefix}use_custom_dates",
             help="Override time window with custom date range",
         )
 
         custom_start, custom_end = None, None
         if use_custom_dates:
-            custom_start, custom_end = render_date_range_picker(key=f"{key_prefix}_custom_dates")
+            custom_start, custom_end = render_date_range_picker(key=f"{filter_prefix}custom_dates")
 
         # Score range filter
         score_filter = st.checkbox(
             "Filter by Score Range",
-            key=f"{key_prefix}_use_score_filter",
+            key=f"{filter_prefix}use_score_filter",
             help="Filter items by score/engagement range",
         )
 
@@ -179,41 +214,29 @@ def render_analytics_filters(available_sources: list[str], key_prefix: str = "an
         if score_filter:
             col1, col2 = st.columns(2)
             with col1:
-                min_score = st.number_input("Min Score", min_value=0, value=0, key=f"{key_prefix}_min_score")
+                min_score = st.number_input("Min Score", min_value=0, value=0, key=f"{filter_prefix}min_score")
             with col2:
-                max_score = st.number_input("Max Score", min_value=0, value=1000, key=f"{key_prefix}_max_score")
+                max_score = st.number_input("Max Score", min_value=0, value=1000, key=f"{filter_prefix}max_score")
 
     # Reset filters button
     if st.button("🔄 Reset Filters", key=f"{key_prefix}_reset"):
-        # Clear session state for this filter set
-        keys_to_clear = [
-            f"{key_prefix}_time_window",
-            f"{key_prefix}_sources",
-            f"{key_prefix}_search",
-            f"{key_prefix}_use_custom_dates",
-            f"{key_prefix}_custom_dates_start",
-            f"{key_prefix}_custom_dates_end",
-            f"{key_prefix}_use_score_filter",
-            f"{key_prefix}_min_score",
-            f"{key_prefix}_max_score",
-        ]
-
-        for key in keys_to_clear:
-            if key in st.session_state:
-                del st.session_state[key]
+        # Clear session state for this filter set: every filter widget key shares the prefix
+        for key in [key for key in st.session_state if key.startswith(filter_prefix)]:
+            del st.session_state[key]
 
         st.rerun()
 
+    # Hashable, order-independent values, so cached fetches keyed on them hit for the same selection
     return {
         "time_window": time_window,
-        "sources": selected_sources,
+        "sources": tuple(sorted(selected_sources)),
         "search_query": search_query,
         "use_custom_dates": use_custom_dates,
         "custom_start": custom_start,
         "custom_end": custom_end,
         "score_filter": score_filter,
-        "min_score": min_score,
-        "max_score": max_score,
+        "min_score": int(min_score) if min_score is not None else None,
+        "max_score": int(max_score) if max_score is not None else None,
     }
 
 
@@ -6,17 +6,66 @@ for the dashboard, including CSV export, pagination, and data formatting.
 """
 
 import io
+from collections.abc import Callable
 from datetime import datetime
+from functools import partial
+from importlib.util import find_spec
 from typing import Any
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
 import streamlit as st
 
 from dashboard.telemetry import track_export_action
 
+TableData = list[dict[str, Any]] | pd.DataFrame
+
+# st.download_button takes a callable as data, run only on click, from Streamlit 1.50
+_DEFERRED_DOWNLOADS = tuple(int(part) for part in st.__version__.split(".")[:2]) >= (1, 50)
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _to_dataframe(data: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build the DataFrame of table rows once per distinct payload, not on every rerun.
+
+    Text columns are stored as Arrow-backed strings, so searching, slicing and
+    exporting them run on Arrow's UTF-8 kernels rather than Python objects.
+    """
+    df = pd.DataFrame(data)
+    # Columns with missing values keep their dtype, so exports don't write pd.NA for them
+    text_columns = [col for col in df.columns if pd.api.types.is_string_dtype(df[col]) and df[col].notna().all()]
+    return df.astype(dict.fromkeys(text_columns, "string[pyarrow]"))
+
+
+def _as_df(data: TableData) -> pd.DataFrame:
+    """Use a DataFrame as is, or build one from a list of rows."""
+    return data if isinstance(data, pd.DataFrame) else _to_dataframe(data)
+
+
+def _frame_hash(df: pd.DataFrame) -> int | None:
+    """Hash a DataFrame's values, or None when cells hold unhashable values such as lists."""
+    try:
+        return int(pd.util.hash_pandas_object(df, index=False).sum())
+    except TypeError:
+        return None
+
+
+def _limit_frame(df: pd.DataFrame, columns: list[str] | None, max_rows: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Select the requested columns, and the rows to display, of a table."""
+    # Filter columns if specified
+    if columns:
+        available_columns = [col for col in columns if col in df.columns]
+        if available_columns:
+            df = df[available_columns]
+
+    return df, df.head(max_rows) if len(df) > max_rows else df
+
 
 def render_data_table_with_export(
-    data: list[dict[str, Any]],
+    data: TableData,
     title: str = "Data Table",
     columns: list[str] | None = None,
     max_rows: int = 1000,
@@ -27,32 +76,22 @@ def render_data_table_with_export(
     Render a data table with export functionality.
 
     Args:
-        data: List of dictionaries containing table data
+        data: List of dictionaries or DataFrame containing table data
         title: Table title
         columns: Optional list of columns to display
         max_rows: Maximum number of rows to display
         enable_export: Whether to show export buttons
         filename_prefix: Prefix for exported filenames
     """
-    if not data:
+    if len(data) == 0:
         st.info("No data available")
         return
 
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-
-    # Filter columns if specified
-    if columns:
-        available_columns = [col for col in columns if col in df.columns]
-        if available_columns:
-            df = df[available_columns]
+    df, df_display = _limit_frame(_as_df(data), columns, max_rows)
 
     # Limit rows
-    if len(df) > max_rows:
+    if len(df) > len(df_display):
         st.warning(f"Showing first {max_rows} rows of {len(df)} total rows")
-        df_display = df.head(max_rows)
-    else:
-        df_display = df
 
     # Display table
     st.subheader(title)
@@ -63,6 +102,29 @@ def render_data_table_with_export(
         render_export_buttons(df, filename_prefix)
 
 
+def _export_timestamp(df: pd.DataFrame, filename_prefix: str) -> str:
+    """
+    Get the timestamp for export filenames, kept while the exported data stays the same.
+
+    A filename that changed every second would give the download buttons a new
+    identity on each rerun; it now only changes when the data does.
+    """
+    # Without a value hash, fall back to the shape
+    fingerprint = (df.shape, _frame_hash(df))
+
+    state_key = f"{filename_prefix}_export_timestamp"
+    stamp = st.session_state.get(state_key)
+    if stamp is None or stamp[0] != fingerprint:
+        stamp = (fingerprint, datetime.now().strftime("%Y%m%d_%H%M%S"))
+        st.session_state[state_key] = stamp
+    return stamp[1]
+
+
+def _download_data(convert: Callable[[pd.DataFrame], bytes], df: pd.DataFrame) -> Callable[[], bytes] | bytes:
+    """Defer serializing an export until its button is clicked, where Streamlit supports it."""
+    return partial(convert, df) if _DEFERRED_DOWNLOADS else convert(df)
+
+
 def render_export_buttons(df: pd.DataFrame, filename_prefix: str = "dataseed_export") -> None:
     """
     Render export buttons for DataFrame.
@@ -74,17 +136,18 @@ def render_export_buttons(df: pd.DataFrame, filename_prefix: str = "dataseed_exp
     if df.empty:
         return
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _export_timestamp(df, filename_prefix)
 
+    # Each file is serialized only when its button is clicked, not on every rerun; older
+    # Streamlit versions serialize them up front, cached per frame
     col1, col2, col3 = st.columns(3)
 
     with col1:
         # CSV Export
-        csv_data = convert_to_csv(df)
         csv_filename = f"{filename_prefix}_{timestamp}.csv"
         if st.download_button(
             label="📄 Export CSV",
-            data=csv_data,
+            data=_download_data(convert_to_csv, df),
             file_name=csv_filename,
             mime="text/csv",
             help="Download data as CSV file",
@@ -93,11 +156,10 @@ def render_export_buttons(df: pd.DataFrame, filename_prefix: str = "dataseed_exp
 
     with col2:
         # JSON Export
-        json_data = convert_to_json(df)
         json_filename = f"{filename_prefix}_{timestamp}.json"
         if st.download_button(
             label="📋 Export JSON",
-            data=json_data,
+            data=_download_data(convert_to_json, df),
             file_name=json_filename,
             mime="application/json",
             help="Download data as JSON file",
@@ -105,85 +167,100 @@ def render_export_buttons(df: pd.DataFrame, filename_prefix: str = "dataseed_exp
             track_export_action("json", filename_prefix, len(df), json_filename)
 
     with col3:
-        # Excel Export (if openpyxl is available)
-        try:
-            excel_data = convert_to_excel(df)
+        # Excel Export (if xlsxwriter is available)
+        if find_spec("xlsxwriter") is None:
+            st.button("📊 Export Excel", disabled=True, help="Excel export requires xlsxwriter package")
+        else:
             excel_filename = f"{filename_prefix}_{timestamp}.xlsx"
             if st.download_button(
                 label="📊 Export Excel",
-                data=excel_data,
+                data=_download_data(convert_to_excel, df),
                 file_name=excel_filename,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 help="Download data as Excel file",
             ):
                 track_export_action("excel", filename_prefix, len(df), excel_filename)
-        except ImportError:
-            st.button("📊 Export Excel", disabled=True, help="Excel export requires openpyxl package")
 
 
-def convert_to_csv(df: pd.DataFrame) -> str:
-    """Convert DataFrame to CSV string."""
-    return df.to_csv(index=False)
+# Serialized exports are memoized on the frame's content, so reruns reuse them
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def convert_to_csv(df: pd.DataFrame) -> bytes:
+    """Convert DataFrame to CSV bytes."""
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException:
+        # Object columns mixing types Arrow can't unify; use the pandas writer instead
+        return df.to_csv(index=False).encode()
+
+    # Arrow writes straight from its column buffers; it quotes every string value
+    output = io.BytesIO()
+    pcsv.write_csv(table, output)
+    return output.getvalue()
 
 
-def convert_to_json(df: pd.DataFrame) -> str:
-    """Convert DataFrame to JSON string."""
-    # Convert datetime columns to ISO format strings
-    df_copy = df.copy()
-    for col in df_copy.columns:
-        if df_copy[col].dtype == "datetime64[ns]":
-            df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def convert_to_json(df: pd.DataFrame) -> bytes:
+    """Convert DataFrame to JSON bytes."""
+    # Convert datetime columns, of any resolution or timezone, to formatted strings;
+    # assign replaces just those columns rather than copying the whole frame
+    datetime_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+    df_copy = df.assign(**{col: df[col].dt.strftime("%Y-%m-%d %H:%M:%S") for col in datetime_cols})
 
-    return df_copy.to_json(orient="records", indent=2)
+    # orjson serializes numpy scalars and writes NaN as null; anything else it can't encode is stringified
+    return orjson.dumps(
+        df_copy.to_dict("records"),
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        default=str,
+    )
 
 
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
 def convert_to_excel(df: pd.DataFrame) -> bytes:
     """Convert DataFrame to Excel bytes."""
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+    # xlsxwriter writes cells straight to XML instead of building openpyxl's per-cell object
+    # graph. Its constant_memory mode is left off: pandas writes cells column by column, and
+    # that mode only keeps cells written in row order.
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
         df.to_excel(writer, index=False, sheet_name="Data")
     return output.getvalue()
 
 
 def render_paginated_table(data: list[dict[str, Any]], page_size: int = 20, key: str = "paginated_table") -> None:
     """
-    Render a paginated table.
+    Render a table showing about page_size rows at a time, scrolling through the rest.
+
+    The grid virtualizes rows in the browser, so moving through the data needs
+    no page picker and no script rerun.
 
     Args:
         data: List of dictionaries containing table data
-        page_size: Number of rows per page
-        key: Unique key for pagination state
+        page_size: Number of rows visible without scrolling
+        key: Unique key for the table widget
     """
     if not data:
         st.info("No data available")
         return
 
-    df = pd.DataFrame(data)
-    total_rows = len(df)
-    total_pages = (total_rows - 1) // page_size + 1
+    df = _to_dataframe(data)
 
-    # Page selector
-    col1, col2, col3 = st.columns([1, 2, 1])
+    # Header row plus page_size rows at the grid's default row height, capped to keep the page compact
+    height = min(35 * page_size + 38, 600)
+    st.dataframe(df, use_container_width=True, height=height, key=key)
 
-    with col2:
-        current_page = st.selectbox(
-            "Page",
-            options=list(range(1, total_pages + 1)),
-            index=0,
-            key=f"{key}_page_selector",
-            format_func=lambda x: f"Page {x} of {total_pages}",
-        )
+    st.caption(f"{len(df)} rows")
 
-    # Calculate slice indices
-    start_idx = (current_page - 1) * page_size
-    end_idx = min(start_idx + page_size, total_rows)
 
-    # Display current page data
-    page_df = df.iloc[start_idx:end_idx]
-    st.dataframe(page_df, use_container_width=True)
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _search_haystack(data: list[dict[str, Any]], columns: tuple[str, ...]) -> pd.Series:
+    """
+    Join the searchable columns of each row into one string to search.
 
-    # Show row info
-    st.caption(f"Showing rows {start_idx + 1}-{end_idx} of {total_rows}")
+    The unit separator between values keeps a query from matching across two columns.
+    """
+    frame = _to_dataframe(data)
+    values = [frame[col].astype(str) for col in columns]
+    return values[0].str.cat(values[1:], sep="\x1f", na_rep="")
 
 
 def render_searchable_table(
@@ -203,19 +280,19 @@ def render_searchable_table(
         st.info("No data available")
         return
 
-    df = pd.DataFrame(data)
+    df = _to_dataframe(data)
 
     # Search input
     search_query = st.text_input("Search table", placeholder="Enter search terms...", key=f"{key}_search")
 
-    # Filter data based on search
+    # Filter data based on search, in one pass over the joined searchable columns
     if search_query:
-        mask = pd.Series([False] * len(df))
-        for col in searchable_columns:
-            if col in df.columns:
-                mask |= df[col].astype(str).str.contains(search_query, case=False, na=False)
-
-        filtered_df = df[mask]
+        columns = tuple(col for col in searchable_columns if col in df.columns)
+        if columns:
+            mask = _search_haystack(data, columns).str.contains(search_query, case=False, regex=False)
+            filtered_df = df[mask.to_numpy()]
+        else:
+            filtered_df = df.iloc[:0]
 
         if filtered_df.empty:
             st.info(f"No results found for '{search_query}'")
@@ -228,6 +305,16 @@ def render_searchable_table(
     st.dataframe(filtered_df, use_container_width=True)
 
 
+def _format_datetime(value: object, fmt: str) -> object:
+    """Format an ISO 8601 string at its own UTC offset, leaving anything else as it is."""
+    if not value or not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime(fmt)
+    except ValueError:
+        return value
+
+
 def format_table_data(
     data: list[dict[str, Any]],
     format_config: dict[str, Any] | None = None,
@@ -245,81 +332,93 @@ def format_table_data(
     if not data or not format_config:
         return data
 
-    formatted_data = []
+    # Format column by column; object dtype keeps untouched values exactly as given
+    df = pd.DataFrame(data, dtype=object)
+    formatted_data = [row.copy() for row in data]
 
-    for row in data:
-        formatted_row = row.copy()
+    for column, config in format_config.items():
+        if column not in df.columns:
+            continue
 
-        for column, config in format_config.items():
-            if column in formatted_row:
-                value = formatted_row[column]
+        values = df[column]
 
-                if config.get("type") == "datetime" and value:
-                    # Format datetime
-                    if isinstance(value, str):
-                        try:
-                            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-                            formatted_row[column] = dt.strftime(config.get("format", "%Y-%m-%d %H:%M"))
-                        except:
-                            pass
+        if config.get("type") == "datetime":
+            # Format datetime strings, leaving values that don't parse as they are. Each value
+            # keeps its own offset: converting the column to one timezone would shift wall times.
+            datetime_format = config.get("format", "%Y-%m-%d %H:%M")
+            formatted = [_format_datetime(value, datetime_format) for value in values]
 
-                elif config.get("type") == "number" and value is not None:
-                    # Format numbers
-                    if config.get("format") == "comma":
-                        formatted_row[column] = f"{value:,}"
-                    elif config.get("format") == "percentage":
-                        formatted_row[column] = f"{value:.1%}"
+        elif config.get("type") == "number":
+            # Format numbers, keeping None as it is
+            number_format = {"comma": "{:,}", "percentage": "{:.1%}"}.get(config.get("format"))
+            if not number_format:
+                continue
+            formatted = [value if value is None else number_format.format(value) for value in values]
 
-                elif config.get("type") == "truncate" and value:
-                    # Truncate text
-                    max_length = config.get("max_length", 50)
-                    if len(str(value)) > max_length:
-                        formatted_row[column] = str(value)[:max_length] + "..."
+        elif config.get("type") == "truncate":
+            # Truncate text
+            max_length = config.get("max_length", 50)
+            text = values.astype(str)
+            too_long = values.notna() & (text.str.len() > max_length)
+            formatted = values.mask(too_long, (text.str.slice(0, max_length) + "...").astype(object)).tolist()
+
+        else:
+            continue
 
-        formatted_data.append(formatted_row)
+        # Write the column back only into rows that have it, so no row gains missing keys
+        for row, value in zip(formatted_data, formatted, strict=True):
+            if column in row:
+                row[column] = value
 
     return formatted_data
 
 
-def render_summary_stats(data: list[dict[str, Any]]) -> None:
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _summarize(data: TableData) -> dict[str, Any]:
+    """Count column types in one pass over the dtypes and describe the numeric columns."""
+    df = _as_df(data)
+    kinds = df.dtypes.map(lambda dtype: dtype.kind)
+    numeric_cols = df.columns[kinds.isin(["i", "u", "f", "c"]).to_numpy()]
+    datetime_cols = df.columns[(kinds == "M").to_numpy()]
+
+    return {
+        "rows": len(df),
+        "columns": len(df.columns),
+        "numeric_columns": len(numeric_cols),
+        "datetime_columns": len(datetime_cols),
+        "numeric_stats": df[numeric_cols].describe() if len(numeric_cols) > 0 else None,
+    }
+
+
+def render_summary_stats(data: TableData) -> None:
     """
     Render summary statistics for the data.
 
     Args:
-        data: Data to analyze
+        data: Rows or DataFrame to analyze
     """
-    if not data:
+    if len(data) == 0:
         return
 
-    df = pd.DataFrame(data)
+    summary = _summarize(data)
 
     st.subheader("📊 Summary Statistics")
 
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Total Rows", len(df))
+        st.metric("Total Rows", summary["rows"])
 
     with col2:
-        st.metric("Columns", len(df.columns))
+        st.metric("Columns", summary["columns"])
 
     with col3:
-        # Find numeric columns
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-        if len(numeric_cols) > 0:
-            st.metric("Numeric Columns", len(numeric_cols))
-        else:
-            st.metric("Numeric Columns", 0)
+        st.metric("Numeric Columns", summary["numeric_columns"])
 
     with col4:
-        # Find datetime columns
-        datetime_cols = df.select_dtypes(include=["datetime64"]).columns
-        if len(datetime_cols) > 0:
-            st.metric("Date Columns", len(datetime_cols))
-        else:
-            st.metric("Date Columns", 0)
+        st.metric("Date Columns", summary["datetime_columns"])
 
     # Show basic statistics for numeric columns
-    if len(numeric_cols) > 0:
+    if summary["numeric_stats"] is not None:
         st.subheader("Numeric Column Statistics")
-        st.dataframe(df[numeric_cols].describe(), use_container_width=True)
+        st.dataframe(summary["numeric_stats"], use_container_width=True)
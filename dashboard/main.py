@@ -6,25 +6,94 @@ Provides overview, source management, and analytics capabilities.
 """
 
 import os
+from pathlib import Path
+from types import MappingProxyType
 
 import streamlit as st
 
 from dashboard.api import get_api_client
+from dashboard.pages.analytics import render_analytics_page
+from dashboard.pages.overview import render_overview_page
+from dashboard.pages.sources import render_sources_page
 from dashboard.state import get_dashboard_state
 from dashboard.telemetry import track_page_view
 
+# Navigation menu entries, built once rather than on every rerun
+NAVIGATION_PAGES = MappingProxyType(
+    {
+        "Overview": {"icon": "📊", "description": "Recent content and search"},
+        "Sources": {"icon": "🔗", "description": "Data source management"},
+        "Analytics": {"icon": "📈", "description": "Trends and statistics"},
+    },
+)
+
+NAVIGATION_OPTIONS = tuple(NAVIGATION_PAGES)
+NAVIGATION_LABELS = MappingProxyType({name: f"{page['icon']} {name}" for name, page in NAVIGATION_PAGES.items()})
+
+# Page renderers by navigation name, resolved once at import instead of on every rerun
+PAGE_RENDERERS = {
+    "Overview": render_overview_page,
+    "Sources": render_sources_page,
+    "Analytics": render_analytics_page,
+}
+
 state = get_dashboard_state()  # <-- Ensure this is called before any state.ui access
 
 
+# Reports viewport changes only when the mobile state flips, and only once a resize has
+# settled, so dragging the window doesn't post a message (and a rerun) per resize event
+MOBILE_DETECTION_SCRIPT = """
+<script>
+let lastIsMobile = null;
+let resizeTimer = null;
+
+function detectMobile() {
+    return window.innerWidth <= 768;
+}
+
+function updateMobileState() {
+    const isMobile = detectMobile();
+    if (isMobile === lastIsMobile) {
+        return;
+    }
+    lastIsMobile = isMobile;
+    if (window.parent && window.parent.postMessage) {
+        window.parent.postMessage({
+            type: 'streamlit:setComponentValue',
+            key: 'is_mobile',
+            value: isMobile
+        }, '*');
+    }
+}
+
+// Check on load, and on resize once it has paused for 150 ms
+window.addEventListener('load', updateMobileState);
+window.addEventListener('resize', () => {
+    clearTimeout(resizeTimer);
+    resizeTimer = setTimeout(updateMobileState, 150);
+});
+</script>
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _load_css_content(path: str, mtime: float) -> str:
+    """Read a stylesheet once per modification time, so edits still show up during development."""
+    with open(path) as f:
+        return f.read()
+
+
 def load_css():
     """Load custom CSS styles for mobile responsiveness."""
     css_path = os.path.join(os.path.dirname(__file__), "style.css")
-    if os.path.exists(css_path):
-        with open(css_path) as f:
-            css_content = f.read()
-        st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
-    else:
+    try:
+        css_content = _load_css_content(css_path, Path(css_path).stat().st_mtime)
+    except OSError:
         st.warning("Custom CSS file not found. Some styling may be missing.")
+        return
+
+    # Injected on every run: Streamlit drops elements a rerun doesn't render again
+    st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
 
 
 def configure_page():
@@ -55,32 +124,9 @@ def configure_page():
     # Load custom CSS
     load_css()
 
-    # Add mobile detection script
-    st.markdown(
-        """
-    <script>
-    function detectMobile() {
-        return window.innerWidth <= 768;
-    }
-    
-    function updateMobileState() {
-        const isMobile = detectMobile();
-        if (window.parent && window.parent.postMessage) {
-            window.parent.postMessage({
-                type: 'streamlit:setComponentValue',
-                key: 'is_mobile',
-                value: isMobile
-            }, '*');
-        }
-    }
-    
-    // Check on load and resize
-    window.addEventListener('load', updateMobileState);
-    window.addEventListener('resize', updateMobileState);
-    </script>
-    """,
-        unsafe_allow_html=True,
-    )
+    # Add mobile detection script. It is emitted on every run: Streamlit removes elements a
+    # rerun doesn't render again, so injecting it once per session would drop it.
+    st.markdown(MOBILE_DETECTION_SCRIPT, unsafe_allow_html=True)
 
 
 def render_sidebar_navigation():
@@ -104,19 +150,15 @@ def render_sidebar_navigation():
     st.sidebar.markdown("---")
 
     # Navigation menu
-    pages = {
-        "Overview": {"icon": "📊", "description": "Recent content and search"},
-        "Sources": {"icon": "🔗", "description": "Data source management"},
-        "Analytics": {"icon": "📈", "description": "Trends and statistics"},
-    }
+    pages = NAVIGATION_PAGES
 
     # Mobile-optimized navigation
     if is_mobile:
         # Use selectbox for mobile to save space
         selected_page = st.sidebar.selectbox(
             "Navigate to:",
-            options=list(pages.keys()),
-            format_func=lambda x: f"{pages[x]['icon']} {x}",
+            options=NAVIGATION_OPTIONS,
+            format_func=NAVIGATION_LABELS.__getitem__,
             key="page_selector_mobile",
             help="Select a page to navigate",
         )
@@ -124,8 +166,8 @@ def render_sidebar_navigation():
         # Use radio buttons for desktop
         selected_page = st.sidebar.radio(
             "Navigation",
-            options=list(pages.keys()),
-            format_func=lambda x: f"{pages[x]['icon']} {x}",
+            options=NAVIGATION_OPTIONS,
+            format_func=NAVIGATION_LABELS.__getitem__,
             key="page_selector",
         )
 
@@ -161,24 +203,11 @@ def load_page_content(page_name: str):
         # Track page view
         track_page_view(page_name)
 
-        if page_name == "Overview":
-            from dashboard.pages.overview import render_overview_page
-
-            render_overview_page()
-        elif page_name == "Sources":
-            from dashboard.pages.sources import render_sources_page
-
-            render_sources_page()
-        elif page_name == "Analytics":
-            from dashboard.pages.analytics import render_analytics_page
-
-            render_analytics_page()
-        else:
+        render_page = PAGE_RENDERERS.get(page_name)
+        if render_page is None:
             st.error(f"Unknown page: {page_name}")
-
-    except ImportError as e:
-        st.error(f"Failed to load page '{page_name}': {str(e)}")
-        st.info("This page is still under development.")
+        else:
+            render_page()
 
     except Exception as e:
         st.error(f"Error rendering page '{page_name}': {str(e)}")
@@ -7,14 +7,17 @@ Uses actual API data with interactive filtering, real-time charts, and CSV expor
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
-from dashboard.api import get_api_client, run_async
+from dashboard.api import cached_sources, get_api_client, run_async
 from dashboard.components.filters import render_analytics_filters, render_chart_controls
 from dashboard.components.tables import render_data_table_with_export, render_summary_stats
 from dashboard.state import get_dashboard_state
-from dashboard.ui import render_auto_refresh_page_wrapper, render_kpi_card, render_page_header
+from dashboard.ui import render_auto_refresh_page_wrapper, render_kpi_card, render_page_header, responsive_columns
 
 # Import charts with fallback for missing plotly
 try:
@@ -30,119 +33,179 @@ except ImportError:
     CHARTS_AVAILABLE = False
 
 
-def load_analytics_data(filters: dict[str, Any]) -> dict[str, Any]:
-    """Load analytics data from API based on filters."""
-    api_client = get_api_client()
+# Item fields shown in the trending and raw data tables, with their column headers.
+# The trending source is only the source ID; showing names would need a lookup.
+# Items are requested with just the table's fields, which include the charted score.
+TRENDING_COLUMNS = {
+    "title": "Title",
+    "score": "Score",
+    "source_id": "Source",
+    "published_at": "Published",
+    "url": "URL",
+}
+TABLE_COLUMNS = {
+    "id": "ID",
+    "title": "Title",
+    "score": "Score",
+    "source_id": "Source ID",
+    "published_at": "Published At",
+    "created_at": "Created At",
+    "url": "URL",
+}
+
+
+# Empty analytics data, shown when loading it failed
+_EMPTY_ANALYTICS: dict[str, Any] = {"stats": {}, "items": [], "time_series": [], "trending": []}
+
+
+@st.cache_data(ttl=30, max_entries=32, show_spinner=False)
+def _cached_analytics(time_window: str, sources: tuple[str, ...], search_query: str) -> dict[str, Any]:
+    """Load the analytics data for a set of filters in one bundled request, cached for half a minute."""
+    bundle = run_async(
+        get_api_client().get_analytics_bundle(
+            window=time_window,
+            sources=list(sources) or None,
+            search_query=search_query or None,
+            trending_limit=20,
+            items_limit=1000,
+            fields=tuple(TABLE_COLUMNS),
+        ),
+    )
+    return {name: bundle[name] for name in _EMPTY_ANALYTICS}
 
-    try:
-        # Get basic stats
-        stats = run_async(
-            api_client.get_stats(
-                window=filters["time_window"],
-                source_name=filters["sources"][0] if len(filters["sources"]) == 1 else None,
-            ),
-        )
-
-        # Get available sources
-        sources_response = run_async(api_client.get_sources())
-        available_sources = [s["name"] for s in sources_response.get("sources", [])]
 
-        # Get items for detailed analysis
-        items = run_async(
-            api_client.get_items_for_analytics(
-                window=filters["time_window"],
-                sources=filters["sources"] if filters["sources"] else None,
-                search_query=filters["search_query"] if filters["search_query"] else None,
-                limit=1000,
-            ),
-        )
-
-        # Get time series data
-        time_series = run_async(
-            api_client.get_time_series_data(
-                window=filters["time_window"],
-                sources=filters["sources"] if filters["sources"] else None,
-            ),
-        )
-
-        # Get trending items
-        trending = run_async(
-            api_client.get_trending_items(
-                window=filters["time_window"],
-                source=filters["sources"][0] if len(filters["sources"]) == 1 else None,
-                limit=20,
-            ),
-        )
-
-        return {
-            "stats": stats,
-            "available_sources": available_sources,
-            "items": items,
-            "time_series": time_series,
-            "trending": trending,
-        }
+# Session state keys for the last complete load and for a pending scheduled refresh
+_SNAPSHOT_KEY = "analytics_snapshot"
+_REVALIDATE_KEY = "analytics_revalidate"
+
+
+def refresh_analytics(manual: bool) -> None:
+    """
+    Refresh callback for the analytics page.
+
+    A manual refresh drops every cached load. A scheduled one only marks the data for
+    revalidation, so the next load can keep it when nothing new was ingested.
+    """
+    cached_sources.clear()
+    if manual:
+        _cached_analytics.clear()
+        st.session_state.pop(_SNAPSHOT_KEY, None)
+    else:
+        st.session_state[_REVALIDATE_KEY] = True
+
+
+def _stats_signature(stats: dict[str, Any]) -> tuple[Any, Any]:
+    """Get the stats that change when items are ingested."""
+    return stats.get("total_items"), stats.get("new_last_window")
+
+
+def _revalidate(cache_args: tuple[str, tuple[str, ...], str]) -> dict[str, Any] | None:
+    """
+    Get the last load for these filters again if the stats show no new items since.
+
+    Only the stats are requested, revalidated against their ETag. When they changed, there
+    is no earlier load to compare with, or the stats endpoint can't filter by the selected
+    sources, the cached load is dropped instead.
+    """
+    snapshot = st.session_state.get(_SNAPSHOT_KEY)
+    time_window, sources, _ = cache_args
+    if snapshot is not None and snapshot[0] == cache_args and len(sources) <= 1:
+        try:
+            stats = run_async(
+                get_api_client().get_stats(window=time_window, source_name=sources[0] if sources else None),
+            )
+        except Exception:
+            stats = None
+
+        if stats is not None and _stats_signature(stats) == _stats_signature(snapshot[1]["stats"]):
+            return {**snapshot[1], "stats": stats}
+
+    _cached_analytics.clear(*cache_args)
+    return None
+
+
+def load_analytics_data(filters: dict[str, Any], available_sources: list[str]) -> dict[str, Any]:
+    """Load analytics data from API based on filters."""
+    cache_args = (filters["time_window"], tuple(sorted(filters["sources"])), filters["search_query"] or "")
+
+    if st.session_state.pop(_REVALIDATE_KEY, False):
+        unchanged = _revalidate(cache_args)
+        if unchanged is not None:
+            return {"available_sources": available_sources, **unchanged}
 
+    try:
+        data = _cached_analytics(*cache_args)
     except Exception as e:
         st.error(f"Failed to load analytics data: {str(e)}")
-        return {"stats": {}, "available_sources": [], "items": [], "time_series": [], "trending": []}
+        return {"available_sources": available_sources, **_EMPTY_ANALYTICS}
+
+    st.session_state[_SNAPSHOT_KEY] = (cache_args, data)
+    return {"available_sources": available_sources, **data}
+
+
+def item_scores(items: list[dict[str, Any]] | pd.DataFrame) -> np.ndarray:
+    """Get the scores of the items that have one, in one pass."""
+    if isinstance(items, pd.DataFrame):
+        if "score" not in items.columns:
+            return np.empty(0)
+        scores = pd.Series(items["score"], dtype="float64")
+    else:
+        scores = pd.Series([item.get("score") for item in items], dtype="float64")
+    return scores.dropna().to_numpy()
+
+
+def truncate_titles(titles: pd.Series, max_length: int = 80) -> pd.Series:
+    """Truncate titles longer than max_length, adding an ellipsis, in one pass of Arrow kernels."""
+    values = pa.array(titles.astype("str"), type=pa.string())
+    truncated = pc.if_else(
+        pc.greater(pc.utf8_length(values), max_length),
+        pc.binary_join_element_wise(pc.utf8_slice_codeunits(values, 0, max_length), "...", ""),
+        values,
+    )
+    return pd.Series(truncated.to_pandas(), index=titles.index, name=titles.name)
 
 
 def render_analytics_overview(stats: dict[str, Any]) -> None:
     """Render overview analytics KPIs with mobile responsiveness."""
-    is_mobile = st.session_state.get("is_mobile", False)
-
     # Prepare data
     new_items = stats.get("new_last_window", 0)
     top_sources = stats.get("top_sources", [])
     top_source = top_sources[0]["source_name"] if top_sources else "N/A"
     avg_score = stats.get("avg_score")
 
-    if is_mobile:
-        # Stack KPI cards vertically on mobile
-        render_kpi_card(
-            title="Total Items",
-            value=f"{stats.get('total_items', 0):,}",
-            help_text="Total content items across all sources",
-        )
-
-        render_kpi_card(title="New Items", value=f"{new_items:,}", help_text="New items in the selected time window")
-
-        render_kpi_card(title="Top Source", value=top_source, help_text="Most active source by volume")
-
-        if avg_score is not None:
-            render_kpi_card(title="Avg Score", value=f"{avg_score:.1f}", help_text="Average engagement score per item")
-        else:
-            render_kpi_card(title="Avg Score", value="N/A", help_text="Average engagement score per item")
-    else:
-        # Use columns on desktop
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            render_kpi_card(
-                title="Total Items",
-                value=f"{stats.get('total_items', 0):,}",
-                help_text="Total content items across all sources",
-            )
-
-        with col2:
-            render_kpi_card(
-                title="New Items",
-                value=f"{new_items:,}",
-                help_text="New items in the selected time window",
-            )
+    kpis = [
+        {
+            "title": "Total Items",
+            "value": f"{stats.get('total_items', 0):,}",
+            "help_text": "Total content items across all sources",
+        },
+        {"title": "New Items", "value": f"{new_items:,}", "help_text": "New items in the selected time window"},
+        {"title": "Top Source", "value": top_source, "help_text": "Most active source by volume"},
+        {
+            "title": "Avg Score",
+            "value": f"{avg_score:.1f}" if avg_score is not None else "N/A",
+            "help_text": "Average engagement score per item",
+        },
+    ]
+
+    # Stack KPI cards vertically on mobile, side by side on desktop
+    for container, kpi in zip(responsive_columns(len(kpis)), kpis, strict=True):
+        with container:
+            render_kpi_card(**kpi)
+
+
+@st.fragment
+def render_charts_tab(data: dict[str, Any]) -> None:
+    """
+    Render the chart options together with the charts they control.
+
+    Running as a fragment, a change to the chart options reruns only this tab
+    instead of reloading the data and re-rendering the whole page.
+    """
+    with st.expander("Customize Charts", expanded=False):
+        chart_controls = render_chart_controls(key_prefix="analytics_chart")
 
-        with col3:
-            render_kpi_card(title="Top Source", value=top_source, help_text="Most active source by volume")
-
-        with col4:
-            if avg_score is not None:
-                render_kpi_card(
-                    title="Avg Score",
-                    value=f"{avg_score:.1f}",
-                    help_text="Average engagement score per item",
-                )
-            else:
-                render_kpi_card(title="Avg Score", value="N/A", help_text="Average engagement score per item")
+    render_charts_section(data, chart_controls)
 
 
 def render_charts_section(data: dict[str, Any], chart_controls: dict[str, Any]) -> None:
@@ -156,14 +219,18 @@ def render_charts_section(data: dict[str, Any], chart_controls: dict[str, Any])
     is_mobile = st.session_state.get("is_mobile", False)
     chart_height = chart_controls["height"] if not is_mobile else 300  # Smaller height on mobile
 
+    scores = item_scores(data["items"])
+
     # Items over time chart
     if data["time_series"]:
         render_items_over_time_chart(data["time_series"], title="Items Ingested Over Time", height=chart_height)
     else:
         st.info("No time series data available")
 
-    if is_mobile:
-        # Stack charts vertically on mobile
+    # Stack charts vertically on mobile, side by side on desktop
+    sources_col, scores_col = responsive_columns(2)
+
+    with sources_col:
         # Top sources chart
         if data["stats"].get("top_sources"):
             render_top_sources_chart(
@@ -174,14 +241,12 @@ def render_charts_section(data: dict[str, Any], chart_controls: dict[str, Any])
         else:
             st.info("No source data available")
 
+    with scores_col:
         # Score distribution chart
-        if data["items"]:
-            # Extract scores for histogram
-            scores = [item.get("score") for item in data["items"] if item.get("score") is not None]
-            if scores:
-                score_data = [{"score": score} for score in scores]
+        if len(data["items"]) > 0:
+            if scores.size:
                 render_score_distribution_chart(
-                    score_data,
+                    scores,
                     title="Score Distribution",
                     height=chart_height // 2,
                     bins=chart_controls["bins"],
@@ -190,38 +255,6 @@ def render_charts_section(data: dict[str, Any], chart_controls: dict[str, Any])
                 st.info("No score data available")
         else:
             st.info("No items data available")
-    else:
-        # Side by side on desktop
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Top sources chart
-            if data["stats"].get("top_sources"):
-                render_top_sources_chart(
-                    data["stats"]["top_sources"],
-                    title="Top Sources by Volume",
-                    height=chart_controls["height"] // 2,
-                )
-            else:
-                st.info("No source data available")
-
-        with col2:
-            # Score distribution chart
-            if data["items"]:
-                # Extract scores for histogram
-                scores = [item.get("score") for item in data["items"] if item.get("score") is not None]
-                if scores:
-                    score_data = [{"score": score} for score in scores]
-                    render_score_distribution_chart(
-                        score_data,
-                        title="Score Distribution",
-                        height=chart_controls["height"] // 2,
-                        bins=chart_controls["bins"],
-                    )
-                else:
-                    st.info("No score data available")
-            else:
-                st.info("No items data available")
 
 
 def render_trending_section(trending_items: list[dict[str, Any]]) -> None:
@@ -232,48 +265,29 @@ def render_trending_section(trending_items: list[dict[str, Any]]) -> None:
         st.info("No trending items found for the selected filters")
         return
 
-    # Format trending data for display
-    trending_data = []
-    for item in trending_items:
-        trending_data.append(
-            {
-                "Title": item.get("title", "")[:80] + "..."
-                if len(item.get("title", "")) > 80
-                else item.get("title", ""),
-                "Score": item.get("score", 0),
-                "Source": item.get("source_id", "Unknown"),  # This would need source name lookup
-                "Published": item.get("published_at", ""),
-                "URL": item.get("url", ""),
-            },
-        )
+    # Format trending data for display, column by column
+    df = pd.DataFrame(trending_items, columns=list(TRENDING_COLUMNS), dtype=object)
+    df = df.fillna({"title": "", "score": 0, "source_id": "Unknown", "published_at": "", "url": ""})
+    df["title"] = truncate_titles(df["title"])
 
     # Display as table
-    df = pd.DataFrame(trending_data)
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(df.rename(columns=TRENDING_COLUMNS), use_container_width=True)
 
 
-def render_data_table_section(items: list[dict[str, Any]], filters: dict[str, Any]) -> None:
+def render_data_table_section(items: list[dict[str, Any]] | pd.DataFrame, filters: dict[str, Any]) -> None:
     """Render the data table section with export functionality."""
     st.subheader("📋 Raw Data")
 
-    if not items:
+    if len(items) == 0:
         st.info("No data available for the selected filters")
         return
 
-    # Format data for table display
-    table_data = []
-    for item in items:
-        table_data.append(
-            {
-                "ID": item.get("id"),
-                "Title": item.get("title", ""),
-                "Score": item.get("score", 0),
-                "Source ID": item.get("source_id"),
-                "Published At": item.get("published_at", ""),
-                "Created At": item.get("created_at", ""),
-                "URL": item.get("url", ""),
-            },
-        )
+    # Format data for table display, column by column
+    table_data = pd.DataFrame(items, columns=list(TABLE_COLUMNS))
+    table_data = table_data.fillna({"title": "", "published_at": "", "created_at": "", "url": ""})
+    # Arrow-backed strings, like the frames tables.py builds from rows
+    table_data = table_data.astype({"title": "string[pyarrow]", "url": "string[pyarrow]"})
+    table_data = table_data.rename(columns=TABLE_COLUMNS)
 
     # Show summary stats
     render_summary_stats(table_data)
@@ -294,8 +308,7 @@ def render_analytics_content():
     """Render the main analytics page content (without auto-refresh wrapper)."""
     # Get available sources for filters
     try:
-        api_client = get_api_client()
-        sources_response = run_async(api_client.get_sources())
+        sources_response = cached_sources()
         available_sources = [s["name"] for s in sources_response.get("sources", [])]
     except Exception as e:
         st.error(f"Failed to load sources: {str(e)}")
@@ -305,13 +318,9 @@ def render_analytics_content():
     with st.sidebar:
         filters = render_analytics_filters(available_sources=available_sources, key_prefix="analytics")
 
-        st.markdown("---")
-
-        chart_controls = render_chart_controls(key_prefix="analytics_chart")
-
     # Load data based on filters
     with st.spinner("Loading analytics data..."):
-        data = load_analytics_data(filters)
+        data = load_analytics_data(filters, available_sources)
 
     # Analytics overview KPIs
     render_analytics_overview(data["stats"])
@@ -322,7 +331,7 @@ def render_analytics_content():
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Charts", "🔥 Trending", "📋 Data Table", "📈 Summary"])
 
     with tab1:
-        render_charts_section(data, chart_controls)
+        render_charts_tab(data)
 
     with tab2:
         render_trending_section(data["trending"])
@@ -334,34 +343,20 @@ def render_analytics_content():
         st.subheader("📈 Analytics Summary")
 
         if data["stats"]:
-            is_mobile = st.session_state.get("is_mobile", False)
+            # Stack summary sections vertically on mobile, side by side on desktop
+            overview_col, sources_col = responsive_columns(2)
 
-            if is_mobile:
-                # Stack summary sections vertically on mobile
+            with overview_col:
                 st.markdown("**Data Overview**")
                 st.write(f"• Total items: {data['stats'].get('total_items', 0):,}")
                 st.write(f"• New items (window): {data['stats'].get('new_last_window', 0):,}")
                 st.write(f"• Max score: {data['stats'].get('max_score', 'N/A')}")
                 st.write(f"• Average score: {data['stats'].get('avg_score', 'N/A')}")
 
+            with sources_col:
                 st.markdown("**Top Sources**")
                 for source in data["stats"].get("top_sources", [])[:5]:
                     st.write(f"• {source['source_name']}: {source['item_count']:,} items")
-            else:
-                # Side by side on desktop
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    st.markdown("**Data Overview**")
-                    st.write(f"• Total items: {data['stats'].get('total_items', 0):,}")
-                    st.write(f"• New items (window): {data['stats'].get('new_last_window', 0):,}")
-                    st.write(f"• Max score: {data['stats'].get('max_score', 'N/A')}")
-                    st.write(f"• Average score: {data['stats'].get('avg_score', 'N/A')}")
-
-                with col2:
-                    st.markdown("**Top Sources**")
-                    for source in data["stats"].get("top_sources", [])[:5]:
-                        st.write(f"• {source['source_name']}: {source['item_count']:,} items")
 
         # Filter summary
         st.markdown("**Applied Filters**")
@@ -389,6 +384,7 @@ def render_analytics_page():
         state=state,
         api_client=api_client,
         key_prefix="analytics",
+        on_refresh=refresh_analytics,
     )
 
 
@@ -11,7 +11,7 @@ from datetime import datetime
 import pandas as pd
 import streamlit as st
 
-from dashboard.api import get_api_client, run_async
+from dashboard.api import cached_stats, cached_trending, get_api_client, run_async
 from dashboard.state import get_dashboard_state
 from dashboard.telemetry import track_export_action
 from dashboard.ui import (
@@ -27,11 +27,9 @@ from dashboard.ui import (
 def render_overview_kpis():
     """Render key performance indicators for the overview with mobile responsiveness."""
     try:
-        api_client = get_api_client()
-
         # Fetch stats from API
         with st.spinner("Loading KPIs..."):
-            stats_data = run_async(api_client.get_stats(window="24h"))
+            stats_data = cached_stats(window="24h")
 
         # Check if mobile for responsive layout
         is_mobile = st.session_state.get("is_mobile", False)
@@ -224,10 +222,8 @@ def render_trending_now():
     st.subheader("Trending Now")
 
     try:
-        api_client = get_api_client()
-
         with st.spinner("Loading trending items..."):
-            trending_items = run_async(api_client.get_trending_items(window="24h", limit=10, use_hot_score=True))
+            trending_items = cached_trending(window="24h", limit=10, use_hot_score=True)
 
         if not trending_items:
             st.info("No trending items found in the last 24 hours.")
@@ -262,10 +258,9 @@ def render_trending_now():
                     published_at = item.get("published_at")
                     if published_at:
                         try:
-                            if isinstance(published_at, str):
-                                pub_time = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-                            else:
-                                pub_time = published_at
+                            pub_time = (
+                                datetime.fromisoformat(published_at) if isinstance(published_at, str) else published_at
+                            )
                             time_str = format_timestamp(pub_time, "relative")
                         except:
                             time_str = "Unknown"
@@ -371,10 +366,7 @@ def render_latest_items_table():
             published_at = item.get("published_at")
             if published_at:
                 try:
-                    if isinstance(published_at, str):
-                        pub_time = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-                    else:
-                        pub_time = published_at
+                    pub_time = datetime.fromisoformat(published_at) if isinstance(published_at, str) else published_at
                     formatted_time = pub_time.strftime("%Y-%m-%d %H:%M")
                 except:
                     formatted_time = "Unknown"
@@ -33,10 +33,7 @@ def get_health_status(source: dict[str, Any]) -> str:
     last_successful = stats.get("last_successful_run")
     if last_successful:
         try:
-            if isinstance(last_successful, str):
-                last_time = datetime.fromisoformat(last_successful.replace("Z", "+00:00"))
-            else:
-                last_time = last_successful
+            last_time = datetime.fromisoformat(last_successful) if isinstance(last_successful, str) else last_successful
 
             time_since_last = datetime.now() - last_time.replace(tzinfo=None)
             if time_since_last > timedelta(hours=2):
@@ -166,10 +163,9 @@ def render_source_card(source: dict[str, Any]):
             last_successful = stats.get("last_successful_run")
             if last_successful:
                 try:
-                    if isinstance(last_successful, str):
-                        last_time = datetime.fromisoformat(last_successful.replace("Z", "+00:00"))
-                    else:
-                        last_time = last_successful
+                    last_time = (
+                        datetime.fromisoformat(last_successful) if isinstance(last_successful, str) else last_successful
+                    )
                     st.caption(format_timestamp(last_time, "relative"))
                 except:
                     st.caption("Unknown")
@@ -178,7 +174,7 @@ def render_source_card(source: dict[str, Any]):
 
             # Last run status (CORRECTED)
             last_status = stats.get("last_run_status")
-            status_emoji = {"completed": "✅", "failed": "❌", "running": "🔄"}.get(last_status, "❓")
+            status_emoji = {"completed": "✅", "partial": "⚠️", "failed": "❌", "running": "🔄"}.get(last_status, "❓")
             status_text = last_status.title() if last_status else "Not Run Yet"
             st.caption(f"Status: {status_emoji} {status_text}")
 
@@ -206,10 +202,11 @@ def render_source_card(source: dict[str, Any]):
                 last_successful = stats.get("last_successful_run")
                 if last_successful:
                     try:
-                        if isinstance(last_successful, str):
-                            last_time = datetime.fromisoformat(last_successful.replace("Z", "+00:00"))
-                        else:
-                            last_time = last_successful
+                        last_time = (
+                            datetime.fromisoformat(last_successful)
+                            if isinstance(last_successful, str)
+                            else last_successful
+                        )
                         st.caption(format_timestamp(last_time, "relative"))
                     except:
                         st.caption("Unknown")
@@ -218,7 +215,10 @@ def render_source_card(source: dict[str, Any]):
 
                 # Last run status (CORRECTED)
                 last_status = stats.get("last_run_status")
-                status_emoji = {"completed": "✅", "failed": "❌", "running": "🔄"}.get(last_status, "❓")
+                status_emoji = {"completed": "✅", "partial": "⚠️", "failed": "❌", "running": "🔄"}.get(
+                    last_status,
+                    "❓",
+                )
                 status_text = last_status.title() if last_status else "Not Run Yet"
                 st.caption(f"Status: {status_emoji} {status_text}")
 
@@ -256,17 +256,19 @@ def render_source_card(source: dict[str, Any]):
 
                         if started_at:
                             try:
-                                if isinstance(started_at, str):
-                                    start_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-                                else:
-                                    start_time = started_at
+                                start_time = (
+                                    datetime.fromisoformat(started_at) if isinstance(started_at, str) else started_at
+                                )
                                 time_str = start_time.strftime("%m/%d %H:%M")
                             except:
                                 time_str = "Unknown"
                         else:
                             time_str = "Unknown"
 
-                        status_emoji = {"completed": "✅", "failed": "❌", "running": "🔄"}.get(status, "❓")
+                        status_emoji = {"completed": "✅", "partial": "⚠️", "failed": "❌", "running": "🔄"}.get(
+                            status,
+                            "❓",
+                        )
                         st.caption(f"{status_emoji} {time_str} - {items} items")
                 else:
                     st.caption("No recent runs")
@@ -386,10 +388,7 @@ def render_source_details_drawer(source_id: int):
                 # Format timestamps
                 if started_at:
                     try:
-                        if isinstance(started_at, str):
-                            start_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-                        else:
-                            start_time = started_at
+                        start_time = datetime.fromisoformat(started_at) if isinstance(started_at, str) else started_at
                         start_str = start_time.strftime("%Y-%m-%d %H:%M:%S")
                     except:
                         start_str = "Unknown"
@@ -398,10 +397,9 @@ def render_source_details_drawer(source_id: int):
 
                 if completed_at:
                     try:
-                        if isinstance(completed_at, str):
-                            end_time = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
-                        else:
-                            end_time = completed_at
+                        end_time = (
+                            datetime.fromisoformat(completed_at) if isinstance(completed_at, str) else completed_at
+                        )
                         end_str = end_time.strftime("%Y-%m-%d %H:%M:%S")
                     except:
                         end_str = "Unknown"
@@ -420,7 +418,7 @@ def render_source_details_drawer(source_id: int):
 
                 # Status with emoji
                 status = run.get("status", "unknown")
-                status_emoji = {"completed": "✅", "failed": "❌", "running": "🔄"}.get(status, "❓")
+                status_emoji = {"completed": "✅", "partial": "⚠️", "failed": "❌", "running": "🔄"}.get(status, "❓")
                 status_display = f"{status_emoji} {status.title()}"
 
                 runs_data.append(
@@ -5,6 +5,7 @@ This module provides centralized session state management for the Streamlit dash
 including user selections, filters, pagination cursors, and refresh intervals.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
@@ -206,18 +207,16 @@ class DashboardState:
 
     def cache_data(self, key: str, data: Any, ttl_minutes: int = 5) -> None:
         """Cache data with TTL."""
-        st.session_state.data_cache[key] = {"data": data, "cached_at": datetime.now(), "ttl_minutes": ttl_minutes}
+        # Expiry on the monotonic clock: a float comparison per lookup, unaffected by clock changes
+        st.session_state.data_cache[key] = {"data": data, "expires_at": time.monotonic() + ttl_minutes * 60}
 
     def get_cached_data(self, key: str) -> Any | None:
         """Get cached data if not expired."""
-        if key not in st.session_state.data_cache:
+        cache_entry = st.session_state.data_cache.get(key)
+        if cache_entry is None:
             return None
 
-        cache_entry = st.session_state.data_cache[key]
-        cached_at = cache_entry["cached_at"]
-        ttl = timedelta(minutes=cache_entry["ttl_minutes"])
-
-        if datetime.now() - cached_at > ttl:
+        if time.monotonic() > cache_entry["expires_at"]:
             # Remove expired cache entry
             del st.session_state.data_cache[key]
             return None
@@ -46,6 +46,21 @@ def render_page_header(title: str, description: str | None = None, show_refresh:
                 st.rerun()
 
 
+def responsive_columns(count: int) -> list:
+    """
+    Get containers for side-by-side content, stacked into one column on mobile.
+
+    Args:
+        count: Number of containers
+
+    Returns:
+        Columns on desktop, or the same stacking container repeated on mobile
+    """
+    if st.session_state.get("is_mobile", False):
+        return [st.container()] * count
+    return st.columns(count)
+
+
 def render_kpi_card(
     title: str,
     value: str,
@@ -458,6 +473,7 @@ def render_auto_refresh_page_wrapper(
     state,
     api_client,
     key_prefix: str | None = None,
+    on_refresh: Callable[[bool], None] | None = None,
 ) -> None:
     """
     Wrapper function that adds auto-refresh functionality to any page.
@@ -468,6 +484,8 @@ def render_auto_refresh_page_wrapper(
         state: Dashboard state instance
         api_client: API client instance
         key_prefix: Optional key prefix, defaults to page_title.lower()
+        on_refresh: Optional callback clearing the page's own caches on refresh, passed
+            whether the refresh was manual
     """
     if key_prefix is None:
         key_prefix = page_title.lower().replace(" ", "_")
@@ -505,6 +523,8 @@ def render_auto_refresh_page_wrapper(
 
             # Clear relevant caches before refresh
             state.clear_cache()
+            if on_refresh is not None:
+                on_refresh(refresh_controls["manual_refresh"])
 
             # Mark as refreshed
             state.mark_refreshed()
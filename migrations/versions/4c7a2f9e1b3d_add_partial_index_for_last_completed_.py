@@ -0,0 +1,32 @@
+"""Add partial index for last completed ingestion run lookup
+
+Revision ID: 4c7a2f9e1b3d
+Revises: 1ed8951c4402
+Create Date: 2026-10-15 10:12:41.503118
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4c7a2f9e1b3d"
+down_revision = "1ed8951c4402"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index for MAX(completed_at) per source over completed runs only
+    op.create_index(
+        "ix_ingestion_runs_last_completed",
+        "ingestion_runs",
+        ["source_id", sa.literal_column("completed_at DESC")],
+        unique=False,
+        postgresql_where=sa.text("status = 'completed'"),
+        sqlite_where=sa.text("status = 'completed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingestion_runs_last_completed", table_name="ingestion_runs")
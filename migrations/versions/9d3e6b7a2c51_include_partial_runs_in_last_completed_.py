@@ -0,0 +1,41 @@
+"""Include partial runs in last completed ingestion run index
+
+Revision ID: 9d3e6b7a2c51
+Revises: 4c7a2f9e1b3d
+Create Date: 2026-10-15 11:47:09.226734
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d3e6b7a2c51"
+down_revision = "4c7a2f9e1b3d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial runs now also serve as ingestion watermarks, so widen the index predicate
+    op.drop_index("ix_ingestion_runs_last_completed", table_name="ingestion_runs")
+    op.create_index(
+        "ix_ingestion_runs_last_completed",
+        "ingestion_runs",
+        ["source_id", sa.literal_column("completed_at DESC")],
+        unique=False,
+        postgresql_where=sa.text("status IN ('completed', 'partial')"),
+        sqlite_where=sa.text("status IN ('completed', 'partial')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingestion_runs_last_completed", table_name="ingestion_runs")
+    op.create_index(
+        "ix_ingestion_runs_last_completed",
+        "ingestion_runs",
+        ["source_id", sa.literal_column("completed_at DESC")],
+        unique=False,
+        postgresql_where=sa.text("status = 'completed'"),
+        sqlite_where=sa.text("status = 'completed'"),
+    )
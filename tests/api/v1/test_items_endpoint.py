@@ -4,10 +4,13 @@ Tests for the /v1/items API endpoint.
 Tests cover successful responses, pagination, filtering, and response schema validation.
 """
 
+import json
 import uuid
 from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
+from itertools import pairwise
 
+import pyarrow as pa
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
@@ -386,3 +389,120 @@ class TestItemsEndpoint:
         for response in responses[1:]:
             response_ids = [item["id"] for item in response["items"]]
             assert response_ids == first_response_ids, "Item ordering should be consistent across requests"
+
+    def test_get_analytics_bundle(self, client: TestClient, test_items: list[ContentItem]):
+        """Test the analytics bundle returns stats, items, time series and trending items together."""
+        response = client.get("/api/v1/items/analytics?window=24h&trending_limit=3")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["stats"]["total_items"] == 5
+        assert data["stats"]["new_last_window"] == 5
+        assert len(data["items"]) == 5
+
+        # Hourly buckets cover every item, including empty hours between them
+        assert sum(point["count"] for point in data["time_series"]) == 5
+        timestamps = [datetime.fromisoformat(point["timestamp"]) for point in data["time_series"]]
+        assert all(later - earlier == timedelta(hours=1) for earlier, later in pairwise(timestamps))
+
+        # Trending items are ranked by score
+        assert [item["score"] for item in data["trending"]] == [420, 310, 250]
+
+    def test_get_analytics_bundle_filter_by_sources(
+        self,
+        client: TestClient,
+        test_items: list[ContentItem],
+        test_sources: list[Source],
+    ):
+        """Test the analytics bundle filters its stats, items and trending items by every given source."""
+        hackernews_source_name = test_sources[0].name
+
+        response = client.get(f"/api/v1/items/analytics?sources={hackernews_source_name}")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["stats"]["total_items"] == 3
+        assert [item["source_id"] for item in data["items"]] == [test_sources[0].id] * 3
+        assert all(item["source_id"] == test_sources[0].id for item in data["trending"])
+
+        both_sources = f"sources={test_sources[0].name}&sources={test_sources[1].name}"
+        response = client.get(f"/api/v1/items/analytics?{both_sources}&q=python")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["stats"]["total_items"] == 5
+        assert [item["title"] for item in data["items"]] == ["Python 3.12 Released"]
+        assert sum(point["count"] for point in data["time_series"]) == 5
+        assert len(data["trending"]) == 5
+
+    def test_get_analytics_bundle_time_series_window(self, client: TestClient, test_items: list[ContentItem]):
+        """Test the analytics bundle's time series only covers items published in the window."""
+        response = client.get("/api/v1/items/analytics?window=2h")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert len(data["items"]) == 5
+        assert sum(point["count"] for point in data["time_series"]) == 2
+
+    def test_get_analytics_bundle_invalid_window(self, client: TestClient, test_items: list[ContentItem]):
+        """Test the analytics bundle rejects an invalid window."""
+        response = client.get("/api/v1/items/analytics?window=abc")
+
+        assert response.status_code == 400
+
+    def test_get_analytics_bundle_item_fields(self, client: TestClient, test_items: list[ContentItem]):
+        """Test the analytics bundle projects the recent items to the requested fields."""
+        response = client.get("/api/v1/items/analytics?fields=id&fields=title&fields=score")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert len(data["items"]) == 5
+        assert all(set(item) == {"id", "title", "score"} for item in data["items"])
+        assert data["items"][0]["title"] == "Programming Tips for Beginners"
+
+        # Trending items are still complete
+        assert "source" in data["trending"][0]
+
+    def test_get_analytics_bundle_unknown_item_field(self, client: TestClient, test_items: list[ContentItem]):
+        """Test the analytics bundle rejects unknown item fields."""
+        response = client.get("/api/v1/items/analytics?fields=title&fields=password")
+
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+
+    def test_get_analytics_bundle_arrow_stream(self, client: TestClient, test_items: list[ContentItem]):
+        """Test the analytics bundle is sent as an Arrow IPC stream when projected items are accepted as one."""
+        response = client.get(
+            "/api/v1/items/analytics?fields=id&fields=title&fields=score&fields=published_at",
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        assert "ETag" in response.headers
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column_names == ["id", "title", "score", "published_at"]
+        assert table.num_rows == 5
+        assert table.column("title")[0].as_py() == "Programming Tips for Beginners"
+
+        # The rest of the bundle travels as JSON in the schema metadata
+        bundle = json.loads(table.schema.metadata[b"bundle"])
+        assert bundle["stats"]["total_items"] == 5
+        assert sum(point["count"] for point in bundle["time_series"]) == 5
+        assert len(bundle["trending"]) == 5
+
+        # The JSON representation of the same bundle has its own ETag
+        arrow_etag = response.headers["ETag"]
+        response = client.get("/api/v1/items/analytics?fields=id&fields=title&fields=score&fields=published_at")
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["ETag"] != arrow_etag
+
+        # Complete items stay JSON
+        response = client.get("/api/v1/items/analytics", headers={"Accept": "application/vnd.apache.arrow.stream"})
+        assert response.headers["content-type"] == "application/json"
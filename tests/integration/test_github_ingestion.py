@@ -11,19 +11,37 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import pytest_asyncio
 from httpx import Response
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.services.ingestion import IngestionService
 from app.models.ingestion import IngestionRun
 from app.models.items import ContentItem
 from app.models.source import Source
-from app.workers.tasks import _ingest_source_async
+from app.schemas.items import ContentItemCreate
+from app.workers.metrics import INGEST_ITEMS
+from app.workers.tasks import (
+    SourceSnapshot,
+    _adaptive_fetch_limit,
+    _ingest_source_async,
+    _run_ingestion,
+    drain_background_writes,
+    get_source_with_last_run,
+    invalidate_source_cache,
+)
 
 # Configure pytest-asyncio
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture(autouse=True)
+def clear_source_cache():
+    """Source lookups are memoized per process; keep tests isolated from each other."""
+    invalidate_source_cache()
+    yield
+    invalidate_source_cache()
+
+
 class TestGitHubIngestionIntegration:
     @pytest.fixture
     def mock_github_http_client(self, sample_github_search_response):
@@ -277,9 +295,10 @@ class TestGitHubIngestionIntegration:
                 # Run the ingestion task
                 result = await _ingest_source_async(mock_task_instance, github_releases_source.id)
 
-        # Verify task result - should get releases from both repositories
-        assert result["processed"] == 4  # 2 releases × 2 repositories
-        assert result["new"] == 4
+        # Verify task result - both repositories' mock releases share external IDs,
+        # so the repeats are dropped before upserting
+        assert result["processed"] == 2
+        assert result["new"] == 2
         assert result["updated"] == 0
         assert result["errors"] == 0
 
@@ -409,7 +428,8 @@ class TestGitHubIngestionIntegration:
 
         with patch.object(GitHubExtractor, "get_http_client", return_value=mock_client):
             with patch("app.core.extractors.github.RedisClient.get_redis", return_value=mock_redis):
-                result = await _ingest_source_async(mock_task_instance, github_search_source.id)
+                with patch("app.workers.tasks.record_ingestion") as record_ingestion:
+                    result = await _ingest_source_async(mock_task_instance, github_search_source.id)
 
         # Should complete successfully with no items processed
         assert result["processed"] == 0
@@ -417,6 +437,12 @@ class TestGitHubIngestionIntegration:
         assert result["updated"] == 0
         assert result["errors"] == 0
 
+        # Empty runs still count towards the ingestion metrics
+        record_ingestion.assert_called_once_with(github_search_source.name, result)
+
+        # The run is closed in the background; wait for it like a worker shutdown does
+        await drain_background_writes()
+
         # Verify ingestion run was still created and completed
         runs_stmt = select(IngestionRun).where(IngestionRun.source_id == github_search_source.id)
         result = await db_session.execute(runs_stmt)
@@ -455,6 +481,9 @@ class TestGitHubIngestionIntegration:
         assert result["updated"] == 0
         assert result["errors"] == 0
 
+        # The run is closed in the background; wait for it like a worker shutdown does
+        await drain_background_writes()
+
         # Verify ingestion run was created and completed
         runs_stmt = select(IngestionRun).where(IngestionRun.source_id == github_search_source.id)
         result = await db_session.execute(runs_stmt)
@@ -464,6 +493,109 @@ class TestGitHubIngestionIntegration:
         run = runs[0]
         assert run.status == "completed"
 
+    async def test_github_ingestion_upserts_in_chunks(
+        self,
+        db_session: AsyncSession,
+        github_search_source: Source,
+        mock_task_instance,
+        mock_github_http_client,
+    ):
+        """Test chunked upserts accumulate run statistics across chunks."""
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = None
+
+        from app.core.extractors.github import GitHubExtractor
+
+        with (
+            patch.object(GitHubExtractor, "get_http_client", return_value=mock_github_http_client),
+            patch("app.core.extractors.github.RedisClient.get_redis", return_value=mock_redis),
+            patch("app.workers.tasks.UPSERT_CHUNK_SIZE", 1),
+        ):
+            new_before = INGEST_ITEMS.labels("github", "new")._value.get()
+            result = await _ingest_source_async(mock_task_instance, github_search_source.id)
+
+        assert result == {"processed": 2, "new": 2, "updated": 0, "errors": 0}
+        assert INGEST_ITEMS.labels("github", "new")._value.get() == new_before + 2
+
+        runs_stmt = select(IngestionRun).where(IngestionRun.source_id == github_search_source.id)
+        run = (await db_session.execute(runs_stmt)).scalar_one()
+        assert run.status == "completed"
+        assert run.items_processed == 2
+        assert run.items_new == 2
+        assert run.items_updated == 0
+
+    async def test_github_ingestion_drops_duplicate_items(
+        self,
+        db_session: AsyncSession,
+        github_search_source: Source,
+        mock_task_instance,
+    ):
+        """Test items repeated across pages are upserted once, keeping the first occurrence."""
+        mock_client = AsyncMock()
+        mock_client.default_headers = {}
+        mock_client.close = AsyncMock()
+
+        source_id = github_search_source.id
+        items = [
+            ContentItemCreate(
+                source_id=source_id,
+                external_id=external_id,
+                title=title,
+                url=f"https://github.com/{external_id}",
+                published_at=datetime.now(UTC),
+            )
+            for external_id, title in [("repo_1", "First"), ("repo_2", "Second"), ("repo_1", "Repeated")]
+        ]
+
+        from app.core.extractors.github import GitHubExtractor
+
+        with (
+            patch.object(GitHubExtractor, "get_http_client", return_value=mock_client),
+            patch.object(GitHubExtractor, "fetch_recent", return_value=items),
+        ):
+            result = await _ingest_source_async(mock_task_instance, source_id)
+
+        assert result == {"processed": 2, "new": 2, "updated": 0, "errors": 0}
+
+        item_stmt = select(ContentItem.title).where(ContentItem.external_id == "repo_1")
+        assert (await db_session.execute(item_stmt)).scalar_one() == "First"
+
+    async def test_github_ingestion_marks_run_failed_on_error(
+        self,
+        db_session: AsyncSession,
+        github_search_source: Source,
+        mock_task_instance,
+    ):
+        """Test an extraction failure marks the ingestion run as failed and re-raises."""
+        mock_client = AsyncMock()
+        mock_client.default_headers = {}
+        mock_client.close = AsyncMock()
+
+        # The failed task rolls back the shared session, which expires the fixture's attributes
+        source_id = github_search_source.id
+
+        from app.core.extractors.github import GitHubExtractor
+
+        with (
+            patch.object(GitHubExtractor, "get_http_client", return_value=mock_client),
+            patch.object(GitHubExtractor, "fetch_recent", side_effect=RuntimeError("upstream exploded")),
+            pytest.raises(RuntimeError, match="upstream exploded"),
+        ):
+            await _ingest_source_async(mock_task_instance, source_id)
+
+        # The failure is recorded in the background; wait for it like a worker shutdown does
+        await drain_background_writes()
+
+        runs_stmt = select(IngestionRun).where(IngestionRun.source_id == source_id)
+        result = await db_session.execute(runs_stmt)
+        runs = result.scalars().all()
+
+        assert len(runs) == 1
+        run = runs[0]
+        assert run.status == "failed"
+        assert run.error_notes == "upstream exploded"
+        assert run.completed_at is not None
+
     async def test_github_ingestion_with_normalization_errors(
         self,
         db_session: AsyncSession,
@@ -728,3 +860,53 @@ class TestGitHubIngestionIntegration:
         # Verify the external IDs are correct
         for item in items:
             assert "#release:" in item.external_id
+
+    async def test_source_lookup_is_cached(
+        self,
+        db_session: AsyncSession,
+        github_search_source: Source,
+    ):
+        """Test repeated source lookups are served from the in-process cache."""
+        source, last_completed = await get_source_with_last_run(db_session, github_search_source.id)
+        assert isinstance(source, SourceSnapshot)
+        assert source.name == github_search_source.name
+        assert last_completed is None
+
+        # Deactivating the source is not visible until the cache is invalidated
+        await db_session.execute(
+            update(Source).where(Source.id == github_search_source.id).values(is_active=False),
+        )
+        await db_session.commit()
+
+        cached_source, _ = await get_source_with_last_run(db_session, github_search_source.id)
+        assert cached_source is source
+
+        invalidate_source_cache()
+        missing_source, _ = await get_source_with_last_run(db_session, github_search_source.id)
+        assert missing_source is None
+
+    @pytest.mark.parametrize(
+        ("config", "gap", "expected"),
+        [
+            ({}, timedelta(hours=24), 100),
+            ({"expected_rate_per_min": 2}, timedelta(minutes=10), 40),
+            ({"expected_rate_per_min": 2}, timedelta(minutes=1), 20),
+            ({"expected_rate_per_min": 2}, timedelta(hours=24), 1000),
+        ],
+    )
+    async def test_adaptive_fetch_limit(self, config, gap, expected):
+        """Test the extractor limit scales with the window since the last run."""
+        now = datetime.now(UTC)
+
+        assert _adaptive_fetch_limit(config, now - gap, now) == expected
+        assert _adaptive_fetch_limit(config, (now - gap).replace(tzinfo=None), now) == expected
+
+    async def test_run_ingestion_reports_coroutine_errors(self, mock_task_instance):
+        """Test an error raised inside the pipeline, RuntimeError included, becomes the task's error result."""
+        failing = AsyncMock(side_effect=RuntimeError("extractor crashed"))
+
+        with patch("app.workers.tasks._ingest_source_async", failing):
+            result = _run_ingestion(mock_task_instance, "github")
+
+        assert result == {"processed": 0, "new": 0, "updated": 0, "error": "extractor crashed"}
+        failing.assert_awaited_once_with(mock_task_instance, "github")
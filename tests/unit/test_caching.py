@@ -4,16 +4,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import QueryParams
 
 from app.api.caching import (
     CacheInfo,
     cache_dependency,
+    cache_view,
     check_conditional_headers,
     generate_data_fingerprint,
     generate_etag,
     generate_request_fingerprint,
+    get_cached_view,
     set_cache_headers,
 )
+from app.schemas.items import AnalyticsBundle, ItemsStats
 
 
 def test_generate_request_fingerprint():
@@ -21,7 +25,7 @@ def test_generate_request_fingerprint():
     # Mock request
     request = MagicMock()
     request.url.path = "/api/v1/items"
-    request.query_params = {"source_name": "hackernews", "limit": "20"}
+    request.query_params = QueryParams({"source_name": "hackernews", "limit": "20"})
 
     fingerprint = generate_request_fingerprint(request)
 
@@ -34,10 +38,18 @@ def test_generate_request_fingerprint():
     assert fingerprint == fingerprint2
 
     # Different request should produce different fingerprint
-    request.query_params = {"source_name": "reddit", "limit": "20"}
+    request.query_params = QueryParams({"source_name": "reddit", "limit": "20"})
     fingerprint3 = generate_request_fingerprint(request)
     assert fingerprint != fingerprint3
 
+    # Every value of a repeated parameter counts, in any order
+    request.query_params = QueryParams([("sources", "hackernews"), ("sources", "reddit")])
+    fingerprint4 = generate_request_fingerprint(request)
+    request.query_params = QueryParams([("sources", "github"), ("sources", "reddit")])
+    assert generate_request_fingerprint(request) != fingerprint4
+    request.query_params = QueryParams([("sources", "reddit"), ("sources", "hackernews")])
+    assert generate_request_fingerprint(request) == fingerprint4
+
 
 @pytest.mark.asyncio
 async def test_generate_data_fingerprint():
@@ -246,3 +258,58 @@ async def test_cache_dependency_200_response():
         assert cache_info.etag == 'W/"abc123"'
         assert cache_info.last_modified == datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
         assert cache_info.should_return_304 is False
+
+
+@pytest.mark.asyncio
+async def test_cache_dependency_analytics_bundle():
+    """Test the analytics bundle's ETag covers every source and its negotiated media type."""
+    request = MagicMock(spec=Request)
+    request.url.path = "/api/v1/items/analytics"
+    request.query_params = QueryParams([("sources", "reddit"), ("sources", "hackernews"), ("q", "python")])
+    request.headers = {}
+
+    response = MagicMock(spec=Response)
+    response.headers = {}
+
+    fingerprint = AsyncMock(return_value=("data456", datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)))
+    with patch("app.api.caching.generate_data_fingerprint", fingerprint):
+        json_info = await cache_dependency(request, response, AsyncMock(spec=AsyncSession), AsyncMock())
+
+        # The data state covers the bundle's unwindowed items of every source, regardless of the query
+        fingerprint.assert_awaited_once()
+        assert fingerprint.await_args.args[1:] == (["hackernews", "reddit"], None, None)
+
+        request.query_params = QueryParams([("sources", "reddit"), ("sources", "hackernews"), ("fields", "title")])
+        projected_info = await cache_dependency(request, response, AsyncMock(spec=AsyncSession), AsyncMock())
+        request.headers = {"accept": "application/vnd.apache.arrow.stream"}
+        arrow_info = await cache_dependency(request, response, AsyncMock(spec=AsyncSession), AsyncMock())
+
+    assert len({json_info.etag, projected_info.etag, arrow_info.etag}) == 3
+
+
+def test_view_cache():
+    """Test computed responses are cached per ETag until they expire or are evicted."""
+    stats = ItemsStats(total_items=1, new_last_window=0, top_sources=[])
+    cache_view('W/"view1"', stats)
+    assert get_cached_view('W/"view1"', ItemsStats) == stats
+    assert get_cached_view('W/"view2"', ItemsStats) is None
+
+    # Entries holding another response model are not returned
+    assert get_cached_view('W/"view1"', AnalyticsBundle) is None
+    cache_view('W/"view1"', stats)
+
+    # Entries expire after the TTL
+    with patch("app.api.caching.time.monotonic", return_value=float("inf")):
+        assert get_cached_view('W/"view1"', ItemsStats) is None
+    assert get_cached_view('W/"view1"', ItemsStats) is None
+
+    # The least recently used entries are evicted once the cache is full
+    views = [ItemsStats(total_items=total, new_last_window=0, top_sources=[]) for total in range(3)]
+    with patch("app.api.caching.VIEW_CACHE_MAX_ENTRIES", 2):
+        cache_view('W/"view1"', views[0])
+        cache_view('W/"view2"', views[1])
+        assert get_cached_view('W/"view1"', ItemsStats) == views[0]
+        cache_view('W/"view3"', views[2])
+        assert get_cached_view('W/"view2"', ItemsStats) is None
+        assert get_cached_view('W/"view1"', ItemsStats) == views[0]
+        assert get_cached_view('W/"view3"', ItemsStats) == views[2]
@@ -14,7 +14,7 @@ from httpx import Response
 
 from app.core.extractors.base import ExtractorConfig
 from app.core.extractors.github import GitHubExtractor
-from app.core.http_client import RateLimitedClient
+from app.core.http_client import RateLimitedClient, close_shared_transport, get_shared_transport
 from app.schemas.items import ContentItemCreate
 
 
@@ -467,6 +467,27 @@ class TestGitHubExtractor:
         call_args = mock_http_client.get_with_response.call_args
         assert "per_page=25" in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_stream_recent(self, search_config, mock_http_client, sample_repository_data, mock_normalizer):
+        """Test stream_recent yields the items returned by fetch_recent."""
+        mock_response = AsyncMock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(return_value=sample_repository_data)
+        mock_response.headers = {}
+        mock_http_client.get_with_response.return_value = mock_response
+
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = None
+
+        with patch("app.core.registry.get_normalizer", return_value=mock_normalizer):
+            extractor = GitHubExtractor(search_config, source_id=1, http_client=mock_http_client)
+
+            with patch.object(extractor, "_get_redis_client", return_value=mock_redis):
+                result = [item async for item in extractor.stream_recent(limit=25)]
+
+        assert len(result) == 2
+        assert all(isinstance(item, ContentItemCreate) for item in result)
+
     @pytest.mark.asyncio
     async def test_health_check_success(self, search_config, mock_http_client):
         """Test successful health check."""
@@ -535,3 +556,27 @@ class TestGitHubExtractor:
         # Should handle unknown mode gracefully
         result = await extractor.fetch_recent()
         assert result == []
+
+    @pytest.mark.asyncio
+    async def test_shared_transport_survives_client_close(self, search_config):
+        """Test that extractors share one transport and closing a client leaves it open."""
+        transport = get_shared_transport()
+        assert get_shared_transport() is transport
+
+        config = search_config.model_copy(update={"transport": transport})
+        first = GitHubExtractor(config, source_id=1).get_http_client()
+        second = GitHubExtractor(config, source_id=1).get_http_client()
+
+        assert (await first._get_client())._transport is transport
+        assert (await second._get_client())._transport is transport
+
+        with patch.object(transport, "aclose", AsyncMock()) as transport_close:
+            await first.close()
+            await second.close()
+            transport_close.assert_not_called()
+
+            await close_shared_transport()
+            transport_close.assert_awaited_once()
+
+        assert get_shared_transport() is not transport
+        await close_shared_transport()
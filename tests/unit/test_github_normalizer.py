@@ -11,6 +11,7 @@ import pytest
 
 from app.core.normalizers.base import NormalizationError
 from app.core.normalizers.github import GitHubNormalizer
+from app.core.registry import get_normalizer
 from app.schemas.items import ContentItemCreate
 
 
@@ -393,3 +394,22 @@ class TestGitHubNormalizer:
         # This should actually succeed because None gets converted to "None" string
         result = normalizer.normalize(problematic_data)
         assert result.external_id == "None"
+
+    def test_normalize_many_collects_failures(self, normalizer, sample_repository_data):
+        """Test batch normalization returns the successes and records failed items."""
+        normalized, failures = normalizer.normalize_many([sample_repository_data, {"full_name": "broken"}])
+
+        assert len(normalized) == 1
+        assert normalized[0].external_id == "123456"
+        assert len(failures) == 1
+        failed_id, error = failures[0]
+        assert failed_id is None
+        assert 0 < len(error) <= 200
+
+    def test_get_normalizer_is_memoized(self):
+        """Test the registry factory reuses normalizer instances per source."""
+        normalizer = get_normalizer("github", 1)
+
+        assert isinstance(normalizer, GitHubNormalizer)
+        assert get_normalizer("github", 1) is normalizer
+        assert get_normalizer("github", 2) is not normalizer